@@ -6,10 +6,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_client import REGISTRY, Counter, Histogram, start_http_server
+from prometheus_client import start_http_server
 from pythonjsonlogger.json import JsonFormatter
 
-from src.api.routes import router
+from src.api.metrics import register_response_cache_metrics
+from src.api.routes import response_cache, router
 from src.config import settings
 from src.core.fonts import font_manager
 
@@ -31,39 +32,8 @@ def setup_logging():
         logger.addHandler(handler)
 
 
-# Prometheus metrics - avoid duplicate registration on reload
-_metrics = {}
-
-
-def get_or_create_metric(metric_class, name, description, **kwargs):
-    """Get existing metric or create new one."""
-    if name in _metrics:
-        return _metrics[name]
-
-    # Check if already in registry
-    if name in REGISTRY._names_to_collectors:
-        collector = REGISTRY._names_to_collectors[name]
-        _metrics[name] = collector
-        return collector
-
-    metric = metric_class(name, description, **kwargs)
-    _metrics[name] = metric
-    return metric
-
-
-RENDER_DURATION = get_or_create_metric(
-    Histogram,
-    'render_duration_seconds',
-    'Time spent rendering images',
-    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
-)
-
-RENDER_ERRORS = get_or_create_metric(
-    Counter,
-    'render_errors_total',
-    'Total number of render errors',
-    labelnames=['error_type']
-)
+# Prometheus metrics for the /generate response cache
+register_response_cache_metrics(response_cache)
 
 
 @asynccontextmanager
@@ -0,0 +1,85 @@
+"""Prometheus metrics shared by the API and the application entry point."""
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from src.utils.cache import LRUCache
+
+# Prometheus metrics - avoid duplicate registration on reload
+_metrics = {}
+
+
+def get_or_create_metric(metric_class, name, description, **kwargs):
+    """Get existing metric or create new one."""
+    if name in _metrics:
+        return _metrics[name]
+
+    # Check if already in registry
+    if name in REGISTRY._names_to_collectors:
+        collector = REGISTRY._names_to_collectors[name]
+        _metrics[name] = collector
+        return collector
+
+    metric = metric_class(name, description, **kwargs)
+    _metrics[name] = metric
+    return metric
+
+
+RENDER_DURATION = get_or_create_metric(
+    Histogram,
+    "render_duration_seconds",
+    "Time spent rendering images",
+    labelnames=["motion_type", "format"],
+    buckets=[0.010, 0.025, 0.050, 0.075, 0.100, 0.150, 0.250, 0.500, 1.000, 2.500],
+)
+
+RENDER_ERRORS = get_or_create_metric(
+    Counter, "render_errors_total", "Total number of render errors", labelnames=["error_type"]
+)
+
+
+class ResponseCacheCollector:
+    """Export response cache statistics read straight from the cache at scrape time."""
+
+    def __init__(self, cache: LRUCache):
+        """
+        Initialize the collector.
+
+        Args:
+            cache: Response cache to report on
+        """
+        self._cache = cache
+
+    def describe(self):
+        """Describe the exported metrics without reading the cache."""
+        yield CounterMetricFamily(
+            "response_cache_hits", "Number of /generate requests served from the response cache"
+        )
+        yield GaugeMetricFamily(
+            "response_cache_size", "Number of rendered responses held in the response cache"
+        )
+
+    def collect(self):
+        """Collect the current hit count and cache size."""
+        # prometheus_client appends the _total suffix to counter names
+        yield CounterMetricFamily(
+            "response_cache_hits",
+            "Number of /generate requests served from the response cache",
+            value=self._cache.hits,
+        )
+        yield GaugeMetricFamily(
+            "response_cache_size",
+            "Number of rendered responses held in the response cache",
+            value=len(self._cache),
+        )
+
+
+def register_response_cache_metrics(cache: LRUCache) -> None:
+    """
+    Register a ResponseCacheCollector for the cache, once per process.
+
+    Args:
+        cache: Response cache to report on
+    """
+    if "response_cache_size" not in REGISTRY._names_to_collectors:
+        REGISTRY.register(ResponseCacheCollector(cache))
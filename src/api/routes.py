@@ -1,21 +1,68 @@
 """API routes - FastAPI endpoint definitions."""
 
+import asyncio
+import hashlib
 import logging
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import JSONResponse
 
+from src.api.metrics import RENDER_DURATION
 from src.api.schemas import ErrorResponse, FontSchema, HealthResponse, RenderRequest
 from src.config import settings
 from src.core.animation import Intensity, MotionConfig, MotionType
-from src.core.engine import rendering_engine
+from src.core.engine import RENDER_VERSION, rendering_engine
 from src.core.fonts import font_manager
 from src.core.text import LayoutConfig, TextStyle
+from src.utils.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Encoded responses keyed by a hash of the request payload
+response_cache = LRUCache(maxsize=settings.response_cache_size)
+
+
+def _render_config() -> str:
+    """
+    Describe the server-side state that changes the encoded output.
+
+    Mixed into cache keys and ETags. Read per request rather than at import,
+    because the font fingerprint only exists once fonts have been loaded.
+
+    Returns:
+        Render version, encoder settings and loaded font set fingerprint
+    """
+    return (
+        f"{RENDER_VERSION}|{settings.animation_format}|{settings.webp_method}"
+        f"|{settings.webp_quality}|{font_manager.fingerprint()}"
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag using weak comparison.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: ETag of the current representation
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    # "*" is deliberately not honored: it would answer 304 for output that was
+    # never rendered, or that would fail the size check
+    if if_none_match is None:
+        return False
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
 
 @router.get(
     "/health",
@@ -30,20 +77,27 @@ async def health_check():
 
 @router.get(
     "/fonts",
-    response_model=list[FontSchema],
+    response_model=None,
     summary="List available fonts",
     description="Returns a list of installed fonts available for rendering.",
+    responses={200: {"description": "Successful Response", "model": list[FontSchema]}},
 )
-async def list_fonts():
+async def list_fonts() -> JSONResponse:
     """List all available fonts."""
+    # Built straight from FontInfo; skips per-item response model validation
     fonts = font_manager.list_fonts()
-    return [FontSchema(id=font.id, name=font.name, categories=font.categories) for font in fonts]
+    return JSONResponse(
+        [{"id": font.id, "name": font.name, "categories": font.categories} for font in fonts]
+    )
 
 
 @router.post(
     "/generate",
     summary="Generate Emoji Image",
-    description="Renders a static WebP or animated APNG based on the request parameters.",
+    description=(
+        "Renders a static WebP or an animated WebP/APNG (per ANIMATION_FORMAT) "
+        "based on the request parameters."
+    ),
     responses={
         200: {
             "description": "Image generated successfully.",
@@ -51,7 +105,9 @@ async def list_fonts():
                 "image/webp": {"schema": {"type": "string", "format": "binary"}},
                 "image/apng": {"schema": {"type": "string", "format": "binary"}},
             },
+            "headers": {"ETag": {"description": "Weak validator for If-None-Match"}},
         },
+        304: {"description": "Not Modified (If-None-Match matched the ETag)."},
         400: {
             "description": "Bad Request (e.g., output size exceeds limit)",
             "model": ErrorResponse,
@@ -63,7 +119,9 @@ async def list_fonts():
         500: {"description": "Rendering Engine Error", "model": ErrorResponse},
     },
 )
-async def generate_emoji(request: RenderRequest):
+async def generate_emoji(
+    request: RenderRequest, if_none_match: Annotated[str | None, Header()] = None
+):
     """Generate an emoji image or animation."""
     request_id = str(uuid.uuid4())[:8]
 
@@ -82,6 +140,22 @@ async def generate_emoji(request: RenderRequest):
         logger.warning(f"Font not found: {request.style.fontId}", extra={"requestId": request_id})
         raise HTTPException(status_code=422, detail=f"Font not found: {request.style.fontId}")
 
+    # Identical requests render identical bytes, so the request hash identifies the output
+    cache_key = hashlib.blake2b(
+        f"{_render_config()}|{request.model_dump_json()}".encode(), digest_size=16
+    ).digest()
+    etag = f'W/"{cache_key.hex()}"'
+
+    if _etag_matches(if_none_match, etag):
+        logger.info("Generate not modified", extra={"requestId": request_id})
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        media_type, data = cached
+        logger.info("Generate cache hit", extra={"requestId": request_id})
+        return Response(content=data, media_type=media_type, headers={"ETag": etag})
+
     try:
         # Convert request to internal models
         style = TextStyle(
@@ -100,9 +174,13 @@ async def generate_emoji(request: RenderRequest):
             speed=request.motion.speed,
         )
 
-        # Render the image
-        result = rendering_engine.render(
-            text=request.text, style=style, layout=layout, motion=motion
+        # Render the image off the event loop (CPU-bound)
+        result = await asyncio.to_thread(
+            rendering_engine.render, text=request.text, style=style, layout=layout, motion=motion
+        )
+
+        RENDER_DURATION.labels(motion_type=request.motion.type, format=result.format).observe(
+            result.render_time_ms / 1000
         )
 
         # Check size limit
@@ -132,7 +210,9 @@ async def generate_emoji(request: RenderRequest):
             },
         )
 
-        return Response(content=result.data, media_type=media_type)
+        response_cache.put(cache_key, (media_type, result.data))
+
+        return Response(content=result.data, media_type=media_type, headers={"ETag": etag})
 
     except ValueError as e:
         logger.warning(f"Validation error: {str(e)}", extra={"requestId": request_id})
@@ -1,7 +1,7 @@
 """Pydantic models for API request/response schemas."""
 
 import re
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -10,6 +10,9 @@ from src.config import settings
 # Regex pattern for hex color validation
 HEX_COLOR_PATTERN = re.compile(r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$")
 
+# HEX color string, validated by pydantic-core without a Python-level validator
+HexColor = Annotated[str, Field(pattern=HEX_COLOR_PATTERN.pattern)]
+
 
 class LayoutSchema(BaseModel):
     """Layout configuration for the rendered image."""
@@ -29,19 +32,13 @@ class StyleSchema(BaseModel):
     fontId: str = Field(
         ..., description="Must match an ID returned by /fonts.", examples=["noto_sans_jp_black"]
     )
-    textColor: str = Field(..., description="Text color in HEX format.", examples=["#FF0000"])
-    outlineColor: str = Field(default="#FFFFFF", description="Outline/stroke color in HEX format.")
+    textColor: HexColor = Field(..., description="Text color in HEX format.", examples=["#FF0000"])
+    outlineColor: HexColor = Field(
+        default="#FFFFFF", description="Outline/stroke color in HEX format."
+    )
     outlineWidth: int = Field(default=0, ge=0, le=20, description="Outline stroke width in pixels.")
     shadow: bool = Field(default=False, description="Enable drop shadow effect.")
 
-    @field_validator("textColor", "outlineColor")
-    @classmethod
-    def validate_hex_color(cls, v: str) -> str:
-        """Validate HEX color format."""
-        if not HEX_COLOR_PATTERN.match(v):
-            raise ValueError(f"Invalid HEX color format: {v}")
-        return v
-
 
 class MotionSchema(BaseModel):
     """Animation/motion configuration."""
@@ -15,6 +15,16 @@ class Settings(BaseSettings):
     # Image size limits (KB)
     max_image_size_kb: int = 1024
 
+    # Number of rendered responses kept in memory (0 disables caching)
+    response_cache_size: int = 1024
+
+    # Lossless WebP encoder effort: method (0-6) and quality (0-100, higher = smaller/slower)
+    webp_method: int = 1
+    webp_quality: int = 0
+
+    # Container for animated output: "webp" (animated WebP) or "apng"
+    animation_format: str = "webp"
+
     # Default font
     default_font_id: str = "noto_sans_jp_bold"
 
@@ -2,10 +2,12 @@
 
 import logging
 import math
-import random
+import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache, partial
 
 import numpy as np
 from PIL import Image
@@ -20,6 +22,10 @@ DEFAULT_FPS = 20
 DEFAULT_DURATION = 1.0  # seconds
 FRAME_DURATION_MS = 50  # 1000 / 20 fps
 
+# Worker threads shared by every AnimationGenerator and RenderingEngine, so
+# creating instances never leaks executors
+frame_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 
 class MotionType(StrEnum):
     """Animation motion types."""
@@ -39,7 +45,7 @@ class Intensity(StrEnum):
     HIGH = "high"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MotionConfig:
     """Motion/animation configuration."""
 
@@ -52,6 +58,36 @@ class MotionConfig:
 INTENSITY_MULTIPLIERS = {Intensity.LOW: 0.5, Intensity.MEDIUM: 1.0, Intensity.HIGH: 2.0}
 
 
+@lru_cache(maxsize=64)
+def _spin_coefficients(size: tuple[int, int], frame_count: int) -> tuple[tuple[float, ...], ...]:
+    """
+    Build inverse affine coefficients for evenly spaced rotations of an image.
+
+    Matches Image.rotate(angle, center=(width // 2, height // 2)) for each
+    angle = 360 / frame_count * i, without recomputing the matrix per frame.
+
+    Args:
+        size: Image size as (width, height)
+        frame_count: Number of frames in one full turn
+
+    Returns:
+        One (a, b, c, d, e, f) coefficient tuple per frame
+    """
+    cx = size[0] // 2
+    cy = size[1] // 2
+    coefficients = []
+
+    for i in range(frame_count):
+        theta = -math.radians((360 / frame_count) * i)
+        cos_t = round(math.cos(theta), 15)
+        sin_t = round(math.sin(theta), 15)
+        c = cos_t * -cx + sin_t * -cy + cx
+        f = -sin_t * -cx + cos_t * -cy + cy
+        coefficients.append((cos_t, sin_t, c, -sin_t, cos_t, f))
+
+    return tuple(coefficients)
+
+
 class AnimationGenerator:
     """Generates animated frames for various motion types."""
 
@@ -131,24 +167,26 @@ class AnimationGenerator:
         Returns:
             List of frames
         """
-        frames = []
-        base_shake = 5  # Base shake amplitude in pixels
-        shake_range = int(base_shake * intensity_mult)
+        offsets = self._shake_offsets(frame_count, intensity_mult)
+        return self._shift_frames(base_image, offsets[:, 0].tolist(), offsets[:, 1].tolist())
 
-        # Seed random for reproducibility (optional)
-        random.seed(42)
+    def _shake_offsets(self, frame_count: int, intensity_mult: float) -> np.ndarray:
+        """
+        Compute the per-frame displacement of a shake animation.
 
-        for _ in range(frame_count):
-            # Random displacement
-            dx = random.randint(-shake_range, shake_range)
-            dy = random.randint(-shake_range, shake_range)
+        Args:
+            frame_count: Number of frames
+            intensity_mult: Intensity multiplier
 
-            # Create new canvas and paste shifted image
-            frame = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-            frame.paste(base_image, (dx, dy), base_image)
-            frames.append(frame)
+        Returns:
+            Integer array of shape (frame_count, 2) with (dx, dy) per frame
+        """
+        base_shake = 5  # Base shake amplitude in pixels
+        shake_range = int(base_shake * intensity_mult)
 
-        return frames
+        # Random displacement, seeded for reproducibility
+        rng = np.random.default_rng(42)
+        return rng.integers(-shake_range, shake_range + 1, size=(frame_count, 2))
 
     def _generate_spin_frames(self, base_image: Image.Image, frame_count: int) -> list[Image.Image]:
         """
@@ -161,22 +199,15 @@ class AnimationGenerator:
         Returns:
             List of frames
         """
-        frames = []
-
-        for i in range(frame_count):
-            # Calculate rotation angle
-            angle = (360 / frame_count) * i
-
-            # Rotate around center with expand=False to maintain size
-            rotated = base_image.rotate(
-                angle,
-                expand=False,
-                center=(base_image.width // 2, base_image.height // 2),
-                resample=Image.Resampling.BICUBIC,
-            )
-            frames.append(rotated)
-
-        return frames
+        # Rotate around center with expand=False to maintain size; the affine
+        # coefficients only depend on size and frame count, so reuse them
+        rotate = partial(
+            base_image.transform,
+            base_image.size,
+            Image.Transform.AFFINE,
+            resample=Image.Resampling.BICUBIC,
+        )
+        return list(frame_pool.map(rotate, _spin_coefficients(base_image.size, frame_count)))
 
     def _generate_bounce_frames(
         self, base_image: Image.Image, frame_count: int, intensity_mult: float
@@ -192,19 +223,64 @@ class AnimationGenerator:
         Returns:
             List of frames
         """
-        frames = []
+        dys = self._bounce_offsets(frame_count, intensity_mult)
+        return self._shift_frames(base_image, [0] * frame_count, dys.tolist())
+
+    def _bounce_offsets(self, frame_count: int, intensity_mult: float) -> np.ndarray:
+        """
+        Compute the per-frame vertical displacement of a bounce animation.
+
+        Args:
+            frame_count: Number of frames
+            intensity_mult: Intensity multiplier
+
+        Returns:
+            Integer array of shape (frame_count,) with dy per frame
+        """
         base_amplitude = 10  # Base bounce amplitude in pixels
         amplitude = int(base_amplitude * intensity_mult)
 
-        for i in range(frame_count):
-            # Calculate Y offset using sine wave
-            t = (2 * math.pi * i) / frame_count
-            dy = int(math.sin(t) * amplitude)
+        # Calculate Y offsets using sine wave; scalar math.sin per frame, because the
+        # vectorized angles differ in the last ulp and truncate to different pixels
+        return np.array(
+            [
+                int(math.sin((2 * math.pi * i) / frame_count) * amplitude)
+                for i in range(frame_count)
+            ],
+            dtype=np.int64,
+        )
+
+    def _shift_frames(
+        self, base_image: Image.Image, dxs: list[int], dys: list[int]
+    ) -> list[Image.Image]:
+        """
+        Copy an image onto transparent canvases of the same size at given offsets.
+
+        All frames share one zeroed NumPy block, and each frame is a plain
+        slice copy of the visible rectangle instead of an alpha paste.
+
+        Args:
+            base_image: Base image
+            dxs: Horizontal offset in pixels, per frame
+            dys: Vertical offset in pixels, per frame
+
+        Returns:
+            Shifted frames
+        """
+        base_arr = np.asarray(base_image.convert("RGBA"))
+        height, width = base_arr.shape[:2]
+        out = np.zeros((len(dxs), height, width, 4), dtype=np.uint8)
 
-            # Create new canvas and paste shifted image
-            frame = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-            frame.paste(base_image, (0, dy), base_image)
-            frames.append(frame)
+        frames = []
+        for frame_arr, dx, dy in zip(out, dxs, dys, strict=True):
+            # Clip the shifted rectangle to the canvas
+            dst_x0, dst_x1 = max(dx, 0), min(width + dx, width)
+            dst_y0, dst_y1 = max(dy, 0), min(height + dy, height)
+            if dst_x0 < dst_x1 and dst_y0 < dst_y1:
+                frame_arr[dst_y0:dst_y1, dst_x0:dst_x1] = base_arr[
+                    dst_y0 - dy : dst_y1 - dy, dst_x0 - dx : dst_x1 - dx
+                ]
+            frames.append(Image.fromarray(frame_arr, "RGBA"))
 
         return frames
 
@@ -219,125 +295,29 @@ class AnimationGenerator:
         Generate gaming (rainbow) animation frames.
 
         Args:
-            base_image: Base image (used if no callback)
+            base_image: Base image (unused; every frame is re-rendered)
             frame_count: Number of frames
             text_color: Original text color
             render_callback: Callback to re-render with new color
 
         Returns:
             List of frames
-        """
-        frames = []
-        base_rgb = hex_to_rgb(text_color)
-
-        for i in range(frame_count):
-            # Calculate hue rotation
-            hue_shift = (360 / frame_count) * i
 
-            if render_callback is not None:
-                # Re-render with rotated color
-                new_color = rotate_hue(*base_rgb, hue_shift)
-                frame = render_callback(new_color)
-                frames.append(frame)
-            else:
-                # Fallback: apply hue shift to existing image
-                frame = self._apply_hue_shift(base_image, hue_shift)
-                frames.append(frame)
-
-        return frames
-
-    def _apply_hue_shift(self, image: Image.Image, hue_shift: float) -> Image.Image:
-        """
-        Apply hue shift to an image using NumPy.
-
-        Args:
-            image: Input image
-            hue_shift: Hue shift in degrees
-
-        Returns:
-            Image with shifted hue
+        Raises:
+            ValueError: If no render_callback is given
         """
-        # Convert to numpy array
-        arr = np.array(image.convert("RGBA"))
-
-        # Only process non-transparent pixels
-        alpha = arr[:, :, 3]
-        mask = alpha > 0
-
-        if not mask.any():
-            return image
+        if render_callback is None:
+            raise ValueError("Gaming animation requires a render_callback")
 
-        # Extract RGB values
-        rgb = arr[:, :, :3].astype(np.float32) / 255.0
+        hue_shifts = [(360 / frame_count) * i for i in range(frame_count)]
 
-        # Convert RGB to HSL and rotate hue
-        # This is a simplified version - for production, consider using skimage or opencv
-        r, g, b = rgb[:, :, 0], rgb[:, :, 1], rgb[:, :, 2]
-
-        max_c = np.maximum(np.maximum(r, g), b)
-        min_c = np.minimum(np.minimum(r, g), b)
-        delta = max_c - min_c
-
-        # Calculate lightness
-        lightness = (max_c + min_c) / 2.0
-
-        # Calculate saturation
-        s = np.zeros_like(lightness)
-        non_zero = delta > 0
-        s[non_zero] = delta[non_zero] / (1 - np.abs(2 * lightness[non_zero] - 1) + 1e-10)
-
-        # Calculate hue
-        h = np.zeros_like(lightness)
-
-        r_max = (max_c == r) & non_zero
-        g_max = (max_c == g) & non_zero
-        b_max = (max_c == b) & non_zero
-
-        h[r_max] = 60.0 * (((g[r_max] - b[r_max]) / (delta[r_max] + 1e-10)) % 6)
-        h[g_max] = 60.0 * (((b[g_max] - r[g_max]) / (delta[g_max] + 1e-10)) + 2)
-        h[b_max] = 60.0 * (((r[b_max] - g[b_max]) / (delta[b_max] + 1e-10)) + 4)
-
-        # Rotate hue
-        h = (h + hue_shift) % 360
-
-        # Convert back to RGB
-        c = (1 - np.abs(2 * lightness - 1)) * s
-        x = c * (1 - np.abs((h / 60.0) % 2 - 1))
-        m = lightness - c / 2.0
-
-        r_new = np.zeros_like(lightness)
-        g_new = np.zeros_like(lightness)
-        b_new = np.zeros_like(lightness)
-
-        idx = (h >= 0) & (h < 60)
-        r_new[idx], g_new[idx], b_new[idx] = c[idx], x[idx], 0
-
-        idx = (h >= 60) & (h < 120)
-        r_new[idx], g_new[idx], b_new[idx] = x[idx], c[idx], 0
-
-        idx = (h >= 120) & (h < 180)
-        r_new[idx], g_new[idx], b_new[idx] = 0, c[idx], x[idx]
-
-        idx = (h >= 180) & (h < 240)
-        r_new[idx], g_new[idx], b_new[idx] = 0, x[idx], c[idx]
-
-        idx = (h >= 240) & (h < 300)
-        r_new[idx], g_new[idx], b_new[idx] = x[idx], 0, c[idx]
-
-        idx = (h >= 300) & (h < 360)
-        r_new[idx], g_new[idx], b_new[idx] = c[idx], 0, x[idx]
-
-        r_new = ((r_new + m) * 255).clip(0, 255).astype(np.uint8)
-        g_new = ((g_new + m) * 255).clip(0, 255).astype(np.uint8)
-        b_new = ((b_new + m) * 255).clip(0, 255).astype(np.uint8)
-
-        # Only apply to masked pixels
-        result = arr.copy()
-        result[:, :, 0][mask] = r_new[mask]
-        result[:, :, 1][mask] = g_new[mask]
-        result[:, :, 2][mask] = b_new[mask]
-
-        return Image.fromarray(result, "RGBA")
+        # Re-render with rotated color, frames in parallel
+        base_rgb = hex_to_rgb(text_color)
+        return list(
+            frame_pool.map(
+                lambda hue_shift: render_callback(rotate_hue(*base_rgb, hue_shift)), hue_shifts
+            )
+        )
 
 
 # Global animation generator instance
@@ -2,9 +2,12 @@
 
 import io
 import logging
+import struct
 import time
+import zlib
 from dataclasses import dataclass
 
+import numpy as np
 from PIL import Image
 
 from src.config import settings
@@ -13,19 +16,76 @@ from src.core.animation import (
     MotionConfig,
     MotionType,
     animation_generator,
+    frame_pool,
 )
 from src.core.fonts import font_manager
 from src.core.text import LayoutConfig, TextStyle, text_renderer
+from src.utils.color import hex_to_rgb, rotate_hue
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever a rendering change alters the bytes produced for the same request,
+# so HTTP caches and ETags from older deployments stop matching
+RENDER_VERSION = "1"
 
-@dataclass
+# zlib level for PNG/APNG output; optimize=True (level 9) was ~8x slower
+# for only 2-3% smaller animations
+APNG_COMPRESS_LEVEL = 6
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """
+    Build a PNG chunk (length, type, data, CRC).
+
+    Args:
+        chunk_type: Four-byte chunk type, e.g. b"IDAT"
+        data: Chunk payload
+
+    Returns:
+        Serialized chunk bytes
+    """
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def _compress_frame(frame: Image.Image) -> tuple[bytes, bytes]:
+    """
+    Encode one frame as a standalone PNG and split out its header and pixel data.
+
+    Args:
+        frame: Frame to encode
+
+    Returns:
+        Tuple of (IHDR payload, concatenated IDAT payload)
+    """
+    buffer = io.BytesIO()
+    frame.convert("RGBA").save(buffer, format="PNG", compress_level=APNG_COMPRESS_LEVEL)
+    png = buffer.getbuffer()
+
+    ihdr = b""
+    idat = []
+    pos = len(PNG_SIGNATURE)
+    while pos < len(png):
+        (length,) = struct.unpack_from(">I", png, pos)
+        chunk_type = bytes(png[pos + 4 : pos + 8])
+        data = bytes(png[pos + 8 : pos + 8 + length])
+        if chunk_type == b"IHDR":
+            ihdr = data
+        elif chunk_type == b"IDAT":
+            idat.append(data)
+        pos += length + 12
+
+    return ihdr, b"".join(idat)
+
+
+@dataclass(slots=True)
 class RenderResult:
     """Result of a render operation."""
 
     data: bytes
-    format: str  # "webp" or "apng"
+    format: str  # "webp" (static or animated) or "apng"
     size_bytes: int
     render_time_ms: float
 
@@ -37,6 +97,14 @@ class RenderingEngine:
         """Initialize the rendering engine."""
         self.text_renderer = text_renderer
         self.animation_generator = animation_generator
+        # Frame generator per motion type
+        self._frame_generators = {
+            MotionType.NONE: self._generate_static_frames,
+            MotionType.SHAKE: self._generate_motion_frames,
+            MotionType.SPIN: self._generate_motion_frames,
+            MotionType.BOUNCE: self._generate_motion_frames,
+            MotionType.GAMING: self._generate_gaming_frames,
+        }
 
     def render(
         self, text: str, style: TextStyle, layout: LayoutConfig, motion: MotionConfig
@@ -56,45 +124,78 @@ class RenderingEngine:
         Raises:
             ValueError: If font_id is not found or validation fails
         """
-        start_time = time.time()
+        # Monotonic clock, so timings never go negative across clock adjustments
+        start_ns = time.perf_counter_ns()
 
         # Validate font exists
         if not font_manager.font_exists(style.font_id):
             raise ValueError(f"Font not found: {style.font_id}")
 
-        # Render base text
-        base_image = self.text_renderer.render_text(text, style, layout)
-
         # Generate frames (single frame for static, multiple for animated)
-        if motion.type == MotionType.NONE:
-            frames = [base_image]
-            output_format = "webp"
-        elif motion.type == MotionType.GAMING:
-            # Gaming mode needs to re-render text with different colors
-            frames = self._generate_gaming_frames(text, style, layout, motion)
-            output_format = "apng"
-        else:
-            # Other animations transform the base image
-            frames = self.animation_generator.generate_frames(base_image, motion, style.text_color)
-            output_format = "apng"
+        frames = self._frame_generators[motion.type](text, style, layout, motion)
 
         # Encode output
-        if output_format == "webp":
+        if motion.type == MotionType.NONE:
+            output_format = "webp"
             data = self._encode_webp(frames[0])
-        else:
+        elif settings.animation_format == "apng":
+            output_format = "apng"
             data = self._encode_apng(frames)
+        else:
+            output_format = "webp"
+            data = self._encode_animated_webp(frames)
 
-        render_time = (time.time() - start_time) * 1000
+        render_time = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return RenderResult(
             data=data, format=output_format, size_bytes=len(data), render_time_ms=render_time
         )
 
+    def _generate_static_frames(
+        self, text: str, style: TextStyle, layout: LayoutConfig, motion: MotionConfig
+    ) -> list[Image.Image]:
+        """
+        Render the text as a single static frame.
+
+        Args:
+            text: Text to render
+            style: Text styling options
+            layout: Layout configuration
+            motion: Motion configuration (unused)
+
+        Returns:
+            List with one frame
+        """
+        return [self.text_renderer.render_text(text, style, layout)]
+
+    def _generate_motion_frames(
+        self, text: str, style: TextStyle, layout: LayoutConfig, motion: MotionConfig
+    ) -> list[Image.Image]:
+        """
+        Render the text once and animate it by transforming the base image.
+
+        Args:
+            text: Text to render
+            style: Text styling options
+            layout: Layout configuration
+            motion: Motion configuration
+
+        Returns:
+            List of frames
+        """
+        base_image = self.text_renderer.render_text(text, style, layout)
+        return self.animation_generator.generate_frames(base_image, motion, style.text_color)
+
     def _generate_gaming_frames(
         self, text: str, style: TextStyle, layout: LayoutConfig, motion: MotionConfig
     ) -> list[Image.Image]:
         """
-        Generate gaming (rainbow) frames by re-rendering with rotated hue.
+        Generate gaming (rainbow) frames by recoloring the text with rotated hue.
+
+        Drawing the fill over whatever lies beneath it (outline, shadow) is
+        linear in the fill color: pixel = background + color * coverage. The
+        text is rendered once in black and once in white to recover both terms,
+        then every frame is produced with a single multiply-add per pixel.
 
         Args:
             text: Text to render
@@ -105,21 +206,35 @@ class RenderingEngine:
         Returns:
             List of frames
         """
-        from src.utils.color import hex_to_rgb, rotate_hue
-
         frame_count = self.animation_generator.get_frame_count(motion.speed)
         base_rgb = hex_to_rgb(style.text_color)
-        frames = []
+        colors = np.array(
+            [rotate_hue(*base_rgb, (360 / frame_count) * i) for i in range(frame_count)],
+            dtype=np.float32,
+        )
 
-        for i in range(frame_count):
-            hue_shift = (360 / frame_count) * i
-            new_color = rotate_hue(*base_rgb, hue_shift)
+        # Render the two passes concurrently: one on the pool, one on this thread
+        black_future = frame_pool.submit(
+            self.text_renderer.render_text, text, style, layout, custom_text_color=(0, 0, 0)
+        )
+        white = np.asarray(
+            self.text_renderer.render_text(text, style, layout, custom_text_color=(255, 255, 255))
+        )
+        black = np.asarray(black_future.result())
+
+        # Fill coverage (0-1) of every pixel touched by the text fill
+        coverage = (white[:, :, 0].astype(np.float32) - black[:, :, 0]) / 255.0
+        mask = coverage > 0
+        background = black[mask, :3].astype(np.float32)
 
-            # Re-render with new color
-            frame = self.text_renderer.render_text(text, style, layout, custom_text_color=new_color)
-            frames.append(frame)
+        recolored = background + colors[:, np.newaxis, :] * coverage[mask][:, np.newaxis]
+        np.clip(recolored, 0.0, 255.0, out=recolored)
+        np.rint(recolored, out=recolored)
 
-        return frames
+        out = np.repeat(black[np.newaxis], frame_count, axis=0)
+        out[:, mask, :3] = recolored
+
+        return [Image.fromarray(frame, "RGBA") for frame in out]
 
     def _encode_webp(self, image: Image.Image) -> bytes:
         """
@@ -132,40 +247,107 @@ class RenderingEngine:
             WebP bytes
         """
         buffer = io.BytesIO()
-        image.save(buffer, format="WEBP", quality=90, lossless=False)
+        # Flat-color text encodes faster and cleaner as lossless VP8L at low effort
+        image.save(
+            buffer,
+            format="WEBP",
+            lossless=True,
+            quality=settings.webp_quality,
+            method=settings.webp_method,
+            exact=True,
+        )
+        return buffer.getvalue()
+
+    def _encode_animated_webp(self, frames: list[Image.Image]) -> bytes:
+        """
+        Encode frames as a lossless animated WebP.
+
+        Args:
+            frames: List of PIL Images
+
+        Returns:
+            Animated WebP bytes
+        """
+        if len(frames) == 0:
+            raise ValueError("No frames to encode")
+
+        buffer = io.BytesIO()
+        # libwebp's animation encoder stores only the changed rectangle per frame
+        frames[0].save(
+            buffer,
+            format="WEBP",
+            save_all=True,
+            append_images=frames[1:],
+            duration=FRAME_DURATION_MS,
+            loop=0,  # Infinite loop
+            lossless=True,
+            quality=settings.webp_quality,
+            method=settings.webp_method,
+            exact=True,
+        )
         return buffer.getvalue()
 
     def _encode_apng(self, frames: list[Image.Image]) -> bytes:
         """
         Encode frames as APNG.
 
+        Distinct frames are compressed as independent PNGs on a thread pool
+        (zlib releases the GIL) and their pixel data is stitched into one APNG
+        container; repeated frames reuse the first copy's compressed data.
+        All frames must have the same size.
+
         Args:
             frames: List of PIL Images
 
         Returns:
             APNG bytes
         """
-        buffer = io.BytesIO()
-
         if len(frames) == 0:
             raise ValueError("No frames to encode")
 
         if len(frames) == 1:
             # Single frame - just save as PNG
-            frames[0].save(buffer, format="PNG", optimize=True)
-        else:
-            # Multiple frames - save as APNG
-            frames[0].save(
-                buffer,
-                format="PNG",
-                save_all=True,
-                append_images=frames[1:],
-                duration=FRAME_DURATION_MS,
-                loop=0,  # Infinite loop
-                optimize=True,
+            buffer = io.BytesIO()
+            frames[0].save(buffer, format="PNG", compress_level=APNG_COMPRESS_LEVEL)
+            return buffer.getvalue()
+
+        # Bounce and shake revisit the same offsets, so compress each distinct frame once
+        slots: dict[bytes, int] = {}
+        distinct: list[Image.Image] = []
+        frame_slots = []
+        for frame in frames:
+            slot = slots.setdefault(frame.tobytes(), len(distinct))
+            if slot == len(distinct):
+                distinct.append(frame)
+            frame_slots.append(slot)
+
+        distinct_compressed = list(frame_pool.map(_compress_frame, distinct))
+        compressed = [distinct_compressed[slot] for slot in frame_slots]
+        ihdr = compressed[0][0]
+        width, height = struct.unpack_from(">II", ihdr)
+
+        # acTL: frame count, 0 = loop forever
+        chunks = [
+            PNG_SIGNATURE,
+            _png_chunk(b"IHDR", ihdr),
+            _png_chunk(b"acTL", struct.pack(">II", len(frames), 0)),
+        ]
+        sequence = 0
+        for index, (_, idat) in enumerate(compressed):
+            # fcTL: full-canvas frame, no disposal, replace (source) blending
+            frame_control = struct.pack(
+                ">IIIIIHHBB", sequence, width, height, 0, 0, FRAME_DURATION_MS, 1000, 0, 0
             )
-
-        return buffer.getvalue()
+            chunks.append(_png_chunk(b"fcTL", frame_control))
+            sequence += 1
+            if index == 0:
+                chunks.append(_png_chunk(b"IDAT", idat))
+            else:
+                chunks.append(_png_chunk(b"fdAT", struct.pack(">I", sequence) + idat))
+                sequence += 1
+        chunks.append(_png_chunk(b"IEND", b""))
+
+        return b"".join(chunks)
 
     def check_size_limit(self, data: bytes) -> bool:
         """
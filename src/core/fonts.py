@@ -1,6 +1,10 @@
 """Font management module - loads and manages available fonts."""
 
+import hashlib
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -8,18 +12,35 @@ from typing import Optional
 from PIL import ImageFont
 
 from src.config import settings
+from src.utils.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Filename keywords per category; each is searched separately because keywords
+# overlap ("sanscript" holds both "sans" and "script")
+_CATEGORY_PATTERNS = {
+    "sans": re.compile(r"sans"),
+    "serif": re.compile(r"serif"),
+    "handwritten": re.compile(r"hand|script|cursive"),
+    "display": re.compile(r"display|decorative|fancy"),
+}
+_SEPARATOR_RE = re.compile(r"[ \-_]+")
 
-@dataclass
+# Sizes opened for every font at startup so first renders skip FreeType face loading
+PRELOAD_FONT_SIZES = (16, 32, 64, 128)
+
+# Maximum number of (font, size) FreeType faces kept open
+FONT_CACHE_SIZE = 512
+
+
+@dataclass(slots=True, frozen=True)
 class FontInfo:
     """Information about an available font."""
 
     id: str
     name: str
     path: str
-    categories: list[str]
+    categories: tuple[str, ...]
 
 
 class FontManager:
@@ -27,7 +48,8 @@ class FontManager:
 
     _instance: Optional["FontManager"] = None
     _fonts: dict[str, FontInfo] = {}
-    _font_cache: dict[str, ImageFont.FreeTypeFont] = {}
+    _font_cache: LRUCache = LRUCache(maxsize=FONT_CACHE_SIZE)
+    _fingerprint: str = ""
 
     def __new__(cls):
         """Singleton pattern for font manager."""
@@ -42,7 +64,8 @@ class FontManager:
             return
         self._initialized = True
         self._fonts = {}
-        self._font_cache = {}
+        self._font_cache = LRUCache(maxsize=FONT_CACHE_SIZE)
+        self._fingerprint = ""
 
     def initialize(self, font_directory: str | None = None) -> None:
         """
@@ -62,21 +85,76 @@ class FontManager:
         # Scan for font files
         font_extensions = {".ttf", ".otf", ".ttc", ".woff", ".woff2"}
 
-        for font_file in font_path.iterdir():
-            if font_file.suffix.lower() in font_extensions:
-                font_id = self._generate_font_id(font_file.stem)
-                font_name = self._generate_font_name(font_file.stem)
-                categories = self._detect_categories(font_file.stem)
+        with os.scandir(font_path) as entries:
+            font_files = [
+                entry
+                for entry in entries
+                if entry.is_file() and Path(entry.name).suffix.lower() in font_extensions
+            ]
+
+        for entry in font_files:
+            stem = Path(entry.name).stem
+            font_id = self._generate_font_id(stem)
+            font_name = self._generate_font_name(stem)
+            categories = self._detect_categories(stem)
+
+            self._fonts[font_id] = FontInfo(
+                id=font_id,
+                name=font_name,
+                path=os.path.abspath(entry.path),
+                categories=tuple(categories),
+            )
+            logger.info(f"Loaded font: {font_id} from {entry.name}")
+
+        # Faces and measurements cached for a replaced font file would otherwise outlive it
+        self._font_cache.clear()
+        self._clear_text_caches()
+
+        self._preload_fonts()
+        self._fingerprint = self._compute_fingerprint()
+        logger.info(f"Total fonts loaded: {len(self._fonts)}")
 
-                self._fonts[font_id] = FontInfo(
-                    id=font_id,
-                    name=font_name,
-                    path=str(font_file.absolute()),
-                    categories=categories,
-                )
-                logger.info(f"Loaded font: {font_id} from {font_file.name}")
+    def _preload_fonts(self) -> None:
+        """Open every font at PRELOAD_FONT_SIZES in parallel and fill the font cache."""
+        jobs = [(font_id, size) for font_id in self._fonts for size in PRELOAD_FONT_SIZES]
 
-        logger.info(f"Total fonts loaded: {len(self._fonts)}")
+        def load(job: tuple[str, int]) -> ImageFont.FreeTypeFont | None:
+            font_id, size = job
+            try:
+                return ImageFont.truetype(self._fonts[font_id].path, size=size)
+            except OSError as e:
+                logger.warning(f"Failed to preload font {font_id} at size {size}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for (font_id, size), font in zip(jobs, pool.map(load, jobs), strict=True):
+                if font is not None:
+                    self._font_cache.put((font_id, size), font)
+
+    def _clear_text_caches(self) -> None:
+        """Drop text measurements and fitted font sizes memoized by font id."""
+        # Imported here because src.core.text imports this module
+        from src.core.text import _fit_square_font_size, _measure_text
+
+        _fit_square_font_size.cache_clear()
+        _measure_text.cache_clear()
+
+    def _compute_fingerprint(self) -> str:
+        """
+        Hash the id, path, size and mtime of every loaded font.
+
+        Returns:
+            Hex digest that changes whenever a font is added, removed or replaced
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        for font_id in sorted(self._fonts):
+            path = self._fonts[font_id].path
+            try:
+                stat = os.stat(path)
+                digest.update(f"{font_id}|{path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+            except OSError:
+                digest.update(f"{font_id}|{path}|missing\n".encode())
+        return digest.hexdigest()
 
     def _generate_font_id(self, filename: str) -> str:
         """
@@ -88,14 +166,8 @@ class FontManager:
         Returns:
             Snake_case font ID
         """
-        # Convert to lowercase and replace spaces/hyphens with underscores
-        font_id = filename.lower()
-        font_id = font_id.replace(" ", "_")
-        font_id = font_id.replace("-", "_")
-        # Remove consecutive underscores
-        while "__" in font_id:
-            font_id = font_id.replace("__", "_")
-        return font_id
+        # Lowercase and collapse runs of spaces/hyphens/underscores into one underscore
+        return _SEPARATOR_RE.sub("_", filename.lower())
 
     def _generate_font_name(self, filename: str) -> str:
         """
@@ -121,16 +193,19 @@ class FontManager:
         Returns:
             List of category strings
         """
-        categories = []
         filename_lower = filename.lower()
+        found = {
+            name for name, pattern in _CATEGORY_PATTERNS.items() if pattern.search(filename_lower)
+        }
+        categories = []
 
-        if "serif" in filename_lower and "sans" not in filename_lower:
+        if "serif" in found and "sans" not in found:
             categories.append("serif")
-        if "sans" in filename_lower:
+        if "sans" in found:
             categories.append("sans-serif")
-        if any(word in filename_lower for word in ["hand", "script", "cursive"]):
+        if "handwritten" in found:
             categories.append("handwritten")
-        if any(word in filename_lower for word in ["display", "decorative", "fancy"]):
+        if "display" in found:
             categories.append("display")
 
         # Default to sans-serif if no category detected
@@ -156,13 +231,13 @@ class FontManager:
         if font_id not in self._fonts:
             raise ValueError(f"Font not found: {font_id}")
 
-        cache_key = f"{font_id}_{size}"
+        font = self._font_cache.get((font_id, size))
 
-        if cache_key not in self._font_cache:
-            font_info = self._fonts[font_id]
-            self._font_cache[cache_key] = ImageFont.truetype(font_info.path, size=size)
+        if font is None:
+            font = ImageFont.truetype(self._fonts[font_id].path, size=size)
+            self._font_cache.put((font_id, size), font)
 
-        return self._font_cache[cache_key]
+        return font
 
     def font_exists(self, font_id: str) -> bool:
         """
@@ -185,6 +260,15 @@ class FontManager:
         """
         return list(self._fonts.values())
 
+    def fingerprint(self) -> str:
+        """
+        Get a fingerprint of the loaded font set, computed when fonts are initialized.
+
+        Returns:
+            Hex digest of the loaded fonts, or an empty string before initialization
+        """
+        return self._fingerprint
+
     def get_font_info(self, font_id: str) -> FontInfo | None:
         """
         Get information about a specific font.
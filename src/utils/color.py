@@ -1,8 +1,16 @@
 """Color conversion utilities: HEX <-> RGB <-> HSL."""
 
 import re
+from functools import lru_cache
 
+# Characters allowed after the leading "#" in a HEX color
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 
+# A complete "#RGB" or "#RRGGBB" color, matched in C by validate_hex_color
+_HEX_COLOR_RE = re.compile(r"#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})")
+
+
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """
     Convert HEX color to RGB tuple.
@@ -18,19 +26,22 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """
     hex_color = hex_color.lstrip("#")
 
-    # Handle 3-character shorthand
+    # Handle 3-character shorthand: one parse, then widen each nibble (0xA -> 0xAA)
     if len(hex_color) == 3:
-        hex_color = "".join(c * 2 for c in hex_color)
+        # int() also accepts "_", "+" and whitespace, so check the digits first
+        if not _HEX_DIGITS.issuperset(hex_color):
+            raise ValueError(f"Invalid hex color: {hex_color}")
+        value = int(hex_color, 16)
+        return ((value >> 8) * 17, (value >> 4 & 0xF) * 17, (value & 0xF) * 17)
 
     if len(hex_color) != 6:
         raise ValueError(f"Invalid hex color: {hex_color}")
 
-    if not re.match(r"^[A-Fa-f0-9]{6}$", hex_color):
-        raise ValueError(f"Invalid hex color: {hex_color}")
-
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    # Decode all three channels in C; anything but 6 hex digits fails to unpack
+    try:
+        r, g, b = bytes.fromhex(hex_color)
+    except ValueError:
+        raise ValueError(f"Invalid hex color: {hex_color}") from None
 
     return (r, g, b)
 
@@ -77,8 +88,8 @@ def rgb_to_hsl(r: int, g: int, b: int) -> tuple[float, float, float]:
         h = 0.0
         s = 0.0
     else:
-        # Saturation
-        s = delta / (1 - abs(2 * lightness - 1))
+        # Saturation; float error can push it just past 1 near black and white
+        s = min(delta / (1 - abs(2 * lightness - 1)), 1.0)
 
         # Hue
         if max_c == r_norm:
@@ -124,9 +135,10 @@ def hsl_to_rgb(h: float, s: float, lightness: float) -> tuple[int, int, int]:
     else:
         r_prime, g_prime, b_prime = c, 0.0, x
 
-    r_val = int((r_prime + m) * 255)
-    g_val = int((g_prime + m) * 255)
-    b_val = int((b_prime + m) * 255)
+    # Round rather than truncate, so RGB -> HSL -> RGB returns the input exactly
+    r_val = round((r_prime + m) * 255)
+    g_val = round((g_prime + m) * 255)
+    b_val = round((b_prime + m) * 255)
 
     # Clamp values to 0-255
     r_clamped = max(0, min(255, r_val))
@@ -136,6 +148,7 @@ def hsl_to_rgb(h: float, s: float, lightness: float) -> tuple[int, int, int]:
     return (r_clamped, g_clamped, b_clamped)
 
 
+@lru_cache(maxsize=1024)
 def rotate_hue(r: int, g: int, b: int, degrees: float) -> tuple[int, int, int]:
     """
     Rotate the hue of an RGB color by a given number of degrees.
@@ -149,11 +162,16 @@ def rotate_hue(r: int, g: int, b: int, degrees: float) -> tuple[int, int, int]:
     Returns:
         Tuple of (R, G, B) values with rotated hue
     """
+    # Whole turns and grays have nothing to rotate
+    if degrees % 360 == 0 or r == g == b:
+        return (r, g, b)
+
     h, s, lightness = rgb_to_hsl(r, g, b)
     h = (h + degrees) % 360
     return hsl_to_rgb(h, s, lightness)
 
 
+@lru_cache(maxsize=256)
 def validate_hex_color(hex_color: str) -> bool:
     """
     Validate a HEX color string.
@@ -164,5 +182,4 @@ def validate_hex_color(hex_color: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$"
-    return bool(re.match(pattern, hex_color))
+    return isinstance(hex_color, str) and _HEX_COLOR_RE.fullmatch(hex_color) is not None
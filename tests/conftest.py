@@ -15,16 +15,37 @@ sys.path.insert(0, str(project_root))
 def reset_singletons():
     """Reset singleton instances between tests."""
     # Reset FontManager singleton
-    from src.core.fonts import FontManager
+    from src.core.fonts import FONT_CACHE_SIZE, FontManager
+    from src.utils.cache import LRUCache
 
     FontManager._instance = None
     FontManager._fonts = {}
-    FontManager._font_cache = {}
+    FontManager._font_cache = LRUCache(maxsize=FONT_CACHE_SIZE)
+    FontManager._fingerprint = ""
     yield
     # Cleanup after test
     FontManager._instance = None
     FontManager._fonts = {}
-    FontManager._font_cache = {}
+    FontManager._font_cache = LRUCache(maxsize=FONT_CACHE_SIZE)
+    FontManager._fingerprint = ""
+
+
+def _clear_caches():
+    """Clear every memoized rendering result."""
+    from src.api.routes import response_cache
+    from src.core.text import _fit_square_font_size, _measure_text
+
+    response_cache.clear()
+    _fit_square_font_size.cache_clear()
+    _measure_text.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Clear memoized rendering results between tests."""
+    _clear_caches()
+    yield
+    _clear_caches()
 
 
 @pytest.fixture
@@ -53,19 +74,18 @@ def mock_settings():
 @pytest.fixture
 def sample_image():
     """Create a sample RGBA image for testing."""
+    import numpy as np
     from PIL import Image
 
-    img = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
     # Draw a simple colored square
-    for x in range(50, 206):
-        for y in range(50, 206):
-            img.putpixel((x, y), (255, 128, 64, 255))
-    return img
+    arr = np.zeros((256, 256, 4), dtype=np.uint8)
+    arr[50:206, 50:206] = (255, 128, 64, 255)
+    return Image.fromarray(arr, "RGBA")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transparent_image():
-    """Create a fully transparent image for testing."""
+    """Create a fully transparent image, shared by the whole session."""
     from PIL import Image
 
     return Image.new("RGBA", (256, 256), (0, 0, 0, 0))
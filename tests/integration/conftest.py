@@ -0,0 +1,31 @@
+"""Pytest fixtures for API integration tests."""
+
+import pytest
+import pytest_asyncio
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the FastAPI app lazily, so collecting unit tests never builds it."""
+    from main import app as _app
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create one API test client shared by the whole session."""
+    from fastapi.testclient import TestClient
+
+    # Not entered as a context manager: the lifespan would start the metrics server
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture
+async def aclient(app):
+    """Create an async API client that calls the app directly over ASGI."""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
@@ -1,25 +1,33 @@
 """Integration tests for API routes."""
 
-import io
-from unittest.mock import patch
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-from fastapi.testclient import TestClient
-from PIL import Image
+from prometheus_client import REGISTRY
 
-from main import app
+from src.api import routes
 from src.core.engine import RenderResult
 from src.core.fonts import FontInfo
 
+# Opaque stand-ins for encoded images; the routes pass them through untouched
+_WEBP_BYTES = b"WEBPFAKE" * 16
+_PNG_BYTES = b"APNGFAKE" * 16
+
+# Request body shared by most /generate tests, serialized once
+_VALID_REQUEST = {
+    "text": "テスト",
+    "style": {"fontId": "noto_sans_jp_bold", "textColor": "#FF0000"},
+}
+_VALID_JSON = json.dumps(_VALID_REQUEST).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 class TestHealthEndpoint:
     """Tests for /health endpoint."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
     def test_health_check_returns_ok(self, client):
         """Test health check returns ok status."""
         response = client.get("/health")
@@ -38,29 +46,25 @@ class TestFontsEndpoint:
     """Tests for /fonts endpoint."""
 
     @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def mock_font_manager(self):
+    def mock_font_manager(self, monkeypatch):
         """Mock font manager."""
-        with patch("src.api.routes.font_manager") as mock:
-            mock.list_fonts.return_value = [
-                FontInfo(
-                    id="noto_sans_jp_bold",
-                    name="Noto Sans JP Bold",
-                    path="/path/to/font.ttf",
-                    categories=["sans-serif"],
-                ),
-                FontInfo(
-                    id="roboto_regular",
-                    name="Roboto Regular",
-                    path="/path/to/roboto.ttf",
-                    categories=["sans-serif"],
-                ),
-            ]
-            yield mock
+        mock = MagicMock()
+        mock.list_fonts.return_value = [
+            FontInfo(
+                id="noto_sans_jp_bold",
+                name="Noto Sans JP Bold",
+                path="/path/to/font.ttf",
+                categories=("sans-serif",),
+            ),
+            FontInfo(
+                id="roboto_regular",
+                name="Roboto Regular",
+                path="/path/to/roboto.ttf",
+                categories=("sans-serif",),
+            ),
+        ]
+        monkeypatch.setattr(routes, "font_manager", mock)
+        return mock
 
     def test_list_fonts_returns_fonts(self, client, mock_font_manager):
         """Test fonts endpoint returns font list."""
@@ -78,60 +82,53 @@ class TestFontsEndpoint:
         font = fonts[0]
         assert "id" in font
         assert "name" in font
-        assert "categories" in font
+        assert font["categories"] == ["sans-serif"]
 
-    def test_list_fonts_empty(self, client):
+    def test_list_fonts_empty(self, client, mock_font_manager):
         """Test fonts endpoint with no fonts."""
-        with patch("src.api.routes.font_manager") as mock:
-            mock.list_fonts.return_value = []
+        mock_font_manager.list_fonts.return_value = []
 
-            response = client.get("/fonts")
+        response = client.get("/fonts")
 
-            assert response.status_code == 200
-            assert response.json() == []
+        assert response.status_code == 200
+        assert response.json() == []
 
 
 class TestGenerateEndpoint:
     """Tests for /generate endpoint."""
 
     @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def mock_font_manager(self):
+    def mock_font_manager(self, monkeypatch):
         """Mock font manager."""
-        with patch("src.api.routes.font_manager") as mock:
-            mock.font_exists.return_value = True
-            yield mock
+        mock = MagicMock()
+        mock.font_exists.return_value = True
+        mock.fingerprint.return_value = "fonts-v1"
+        monkeypatch.setattr(routes, "font_manager", mock)
+        return mock
 
     @pytest.fixture
-    def mock_rendering_engine(self):
-        """Mock rendering engine."""
-        with patch("src.api.routes.rendering_engine") as mock:
-            # Create a simple test image
-            img = Image.new("RGBA", (256, 256), (255, 0, 0, 255))
-            buffer = io.BytesIO()
-            img.save(buffer, format="WEBP")
-            webp_data = buffer.getvalue()
-
-            mock.render.return_value = RenderResult(
-                data=webp_data, format="webp", size_bytes=len(webp_data), render_time_ms=50.0
-            )
-            mock.check_size_limit.return_value = True
-            yield mock
+    def mock_rendering_engine(self, monkeypatch):
+        """Fake rendering engine built from plain functions; render calls are recorded."""
+        result = RenderResult(
+            data=_WEBP_BYTES,
+            format="webp",
+            size_bytes=len(_WEBP_BYTES),
+            render_time_ms=50.0,
+        )
+        fake = SimpleNamespace(calls=[])
 
-    @pytest.fixture
-    def valid_request(self):
-        """Create valid request payload."""
-        return {"text": "テスト", "style": {"fontId": "noto_sans_jp_bold", "textColor": "#FF0000"}}
+        def render(**kwargs):
+            fake.calls.append(kwargs)
+            return result
 
-    def test_generate_static_image(
-        self, client, mock_font_manager, mock_rendering_engine, valid_request
-    ):
+        fake.render = render
+        fake.check_size_limit = lambda data: True
+        monkeypatch.setattr(routes, "rendering_engine", fake)
+        return fake
+
+    def test_generate_static_image(self, client, mock_font_manager, mock_rendering_engine):
         """Test generating a static image."""
-        response = client.post("/generate", json=valid_request)
+        response = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "image/webp"
@@ -151,14 +148,13 @@ class TestGenerateEndpoint:
     def test_generate_with_animation(self, client, mock_font_manager, mock_rendering_engine):
         """Test generating with animation."""
         # Update mock for APNG output
-        img = Image.new("RGBA", (256, 256), (255, 0, 0, 255))
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        png_data = buffer.getvalue()
-
-        mock_rendering_engine.render.return_value = RenderResult(
-            data=png_data, format="apng", size_bytes=len(png_data), render_time_ms=100.0
+        result = RenderResult(
+            data=_PNG_BYTES,
+            format="apng",
+            size_bytes=len(_PNG_BYTES),
+            render_time_ms=100.0,
         )
+        mock_rendering_engine.render = lambda **kwargs: result
 
         request = {
             "text": "テスト",
@@ -171,20 +167,19 @@ class TestGenerateEndpoint:
         assert response.status_code == 200
         assert response.headers["content-type"] == "image/apng"
 
-    def test_generate_font_not_found(self, client, mock_rendering_engine):
+    def test_generate_font_not_found(self, client, mock_font_manager, mock_rendering_engine):
         """Test error when font not found."""
-        with patch("src.api.routes.font_manager") as mock_fm:
-            mock_fm.font_exists.return_value = False
+        mock_font_manager.font_exists.return_value = False
 
-            request = {
-                "text": "テスト",
-                "style": {"fontId": "nonexistent_font", "textColor": "#FF0000"},
-            }
+        request = {
+            "text": "テスト",
+            "style": {"fontId": "nonexistent_font", "textColor": "#FF0000"},
+        }
 
-            response = client.post("/generate", json=request)
+        response = client.post("/generate", json=request)
 
-            assert response.status_code == 422
-            assert "Font not found" in response.json()["detail"]
+        assert response.status_code == 422
+        assert "Font not found" in response.json()["detail"]
 
     def test_generate_invalid_hex_color(self, client, mock_font_manager, mock_rendering_engine):
         """Test error with invalid hex color."""
@@ -216,22 +211,18 @@ class TestGenerateEndpoint:
 
         assert response.status_code == 422
 
-    def test_generate_size_limit_exceeded(self, client, valid_request):
+    def test_generate_size_limit_exceeded(self, client, mock_font_manager, mock_rendering_engine):
         """Test error when output size exceeds limit."""
-        with (
-            patch("src.api.routes.font_manager") as mock_fm,
-            patch("src.api.routes.rendering_engine") as mock_engine,
-        ):
-            mock_fm.font_exists.return_value = True
-            mock_engine.check_size_limit.return_value = False
-            mock_engine.render.return_value = RenderResult(
-                data=b"x" * (2 * 1024 * 1024),
-                format="webp",
-                size_bytes=2 * 1024 * 1024,
-                render_time_ms=50.0,
-            )
-
-            response = client.post("/generate", json=valid_request)
+        result = RenderResult(
+            data=b"",
+            format="webp",
+            size_bytes=2 * 1024 * 1024,
+            render_time_ms=50.0,
+        )
+        mock_rendering_engine.render = lambda **kwargs: result
+        mock_rendering_engine.check_size_limit = lambda data: False
+
+        response = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
 
         assert response.status_code == 400
         assert "exceeds limit" in response.json()["detail"]
@@ -274,54 +265,175 @@ class TestGenerateEndpoint:
 
         assert response.status_code == 200
 
-    def test_generate_all_motion_types(self, client, mock_font_manager, mock_rendering_engine):
+    @pytest.mark.asyncio
+    async def test_generate_all_motion_types(
+        self, aclient, mock_font_manager, mock_rendering_engine
+    ):
         """Test all motion types."""
         motion_types = ["none", "shake", "spin", "bounce", "gaming"]
-
-        for motion_type in motion_types:
-            request = {
+        requests = [
+            {
                 "text": "テスト",
                 "style": {"fontId": "noto_sans_jp_bold", "textColor": "#FF0000"},
                 "motion": {"type": motion_type},
             }
+            for motion_type in motion_types
+        ]
 
-            response = client.post("/generate", json=request)
+        responses = await asyncio.gather(
+            *(aclient.post("/generate", json=request) for request in requests)
+        )
 
-            assert response.status_code == 200, f"Failed for motion type: {motion_type}"
+        # Compare all cases at once so one failure does not hide the others
+        statuses = {m: r.status_code for m, r in zip(motion_types, responses, strict=True)}
+        assert statuses == dict.fromkeys(motion_types, 200)
 
-    def test_generate_all_intensities(self, client, mock_font_manager, mock_rendering_engine):
+    @pytest.mark.asyncio
+    async def test_generate_all_intensities(
+        self, aclient, mock_font_manager, mock_rendering_engine
+    ):
         """Test all intensity levels."""
         intensities = ["low", "medium", "high"]
-
-        for intensity in intensities:
-            request = {
+        requests = [
+            {
                 "text": "テスト",
                 "style": {"fontId": "noto_sans_jp_bold", "textColor": "#FF0000"},
                 "motion": {"type": "shake", "intensity": intensity},
             }
+            for intensity in intensities
+        ]
+
+        responses = await asyncio.gather(
+            *(aclient.post("/generate", json=request) for request in requests)
+        )
+
+        statuses = {i: r.status_code for i, r in zip(intensities, responses, strict=True)}
+        assert statuses == dict.fromkeys(intensities, 200)
+
+    def test_generate_repeat_request_served_from_cache(
+        self, client, mock_font_manager, mock_rendering_engine
+    ):
+        """Test identical requests render once and reuse the cached bytes."""
+        first = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+        second = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
 
-            response = client.post("/generate", json=request)
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.headers["content-type"] == "image/webp"
+        assert len(mock_rendering_engine.calls) == 1
 
-            assert response.status_code == 200, f"Failed for intensity: {intensity}"
+    def test_generate_exports_response_cache_metrics(
+        self, client, mock_font_manager, mock_rendering_engine
+    ):
+        """Test cache hits are exported as a counter alongside the cache size."""
+        before = REGISTRY.get_sample_value("response_cache_hits_total")
+
+        client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+        client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+
+        assert REGISTRY.get_sample_value("response_cache_hits_total") == before + 1
+        assert REGISTRY.get_sample_value("response_cache_size") == 1
+
+    def test_generate_observes_render_duration(
+        self, client, mock_font_manager, mock_rendering_engine
+    ):
+        """Test each render is recorded in the render_duration_seconds histogram."""
+        labels = {"motion_type": "none", "format": "webp"}
+        before = REGISTRY.get_sample_value("render_duration_seconds_count", labels) or 0.0
+
+        client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+        client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+
+        # The repeat is served from the response cache and not rendered again
+        assert REGISTRY.get_sample_value("render_duration_seconds_count", labels) == before + 1
+
+    def test_generate_returns_etag(self, client, mock_font_manager, mock_rendering_engine):
+        """Test generated images carry a weak ETag that is stable across requests."""
+        first = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+        second = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
+        other = client.post("/generate", json={**_VALID_REQUEST, "text": "別"})
+
+        assert first.headers["etag"].startswith('W/"')
+        assert second.headers["etag"] == first.headers["etag"]
+        assert other.headers["etag"] != first.headers["etag"]
+
+    def test_generate_304_on_if_none_match(self, client, mock_font_manager, mock_rendering_engine):
+        """Test a matching If-None-Match gets an empty 304 without rendering."""
+        etag = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS).headers["etag"]
+
+        response = client.post(
+            "/generate",
+            content=_VALID_JSON,
+            headers={**_JSON_HEADERS, "If-None-Match": f'"other", {etag}'},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert len(mock_rendering_engine.calls) == 1
+
+    def test_generate_stale_if_none_match_renders(
+        self, client, mock_font_manager, mock_rendering_engine
+    ):
+        """Test a non-matching If-None-Match gets the full image."""
+        response = client.post(
+            "/generate",
+            content=_VALID_JSON,
+            headers={**_JSON_HEADERS, "If-None-Match": 'W/"stale"'},
+        )
+
+        assert response.status_code == 200
+        assert response.content == _WEBP_BYTES
+
+    def test_generate_wildcard_if_none_match_renders(
+        self, client, mock_font_manager, mock_rendering_engine
+    ):
+        """Test If-None-Match: * does not skip rendering a request never seen before."""
+        response = client.post(
+            "/generate", content=_VALID_JSON, headers={**_JSON_HEADERS, "If-None-Match": "*"}
+        )
+
+        assert response.status_code == 200
+        assert response.content == _WEBP_BYTES
+        assert len(mock_rendering_engine.calls) == 1
 
-    def test_generate_rendering_error(
-        self, client, mock_font_manager, mock_rendering_engine, valid_request
+    def test_generate_font_change_invalidates_etag(
+        self, client, mock_font_manager, mock_rendering_engine
     ):
+        """Test replacing the loaded fonts retires old ETags and cached responses."""
+        etag = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS).headers["etag"]
+        mock_font_manager.fingerprint.return_value = "fonts-v2"
+
+        response = client.post(
+            "/generate", content=_VALID_JSON, headers={**_JSON_HEADERS, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(mock_rendering_engine.calls) == 2
+
+    def test_generate_rendering_error(self, client, mock_font_manager, mock_rendering_engine):
         """Test handling of rendering errors."""
-        mock_rendering_engine.render.side_effect = Exception("Rendering failed")
 
-        response = client.post("/generate", json=valid_request)
+        def render(**kwargs):
+            raise RuntimeError("Rendering failed")
+
+        mock_rendering_engine.render = render
+
+        response = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
 
         assert response.status_code == 500
         assert "Internal rendering error" in response.json()["detail"]
 
-    def test_generate_validation_error(
-        self, client, mock_font_manager, mock_rendering_engine, valid_request
-    ):
+    def test_generate_validation_error(self, client, mock_font_manager, mock_rendering_engine):
         """Test handling of validation errors."""
-        mock_rendering_engine.render.side_effect = ValueError("Invalid parameter")
 
-        response = client.post("/generate", json=valid_request)
+        def render(**kwargs):
+            raise ValueError("Invalid parameter")
+
+        mock_rendering_engine.render = render
+
+        response = client.post("/generate", content=_VALID_JSON, headers=_JSON_HEADERS)
 
         assert response.status_code == 422
 
@@ -329,25 +441,21 @@ class TestGenerateEndpoint:
 class TestOpenAPISpec:
     """Tests for OpenAPI specification."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_openapi_json_available(self, client):
-        """Test OpenAPI JSON is available."""
+    @pytest.fixture(scope="class")
+    def openapi_spec(self, client):
+        """Fetch and decode the OpenAPI spec once for the class."""
         response = client.get("/openapi.json")
-
         assert response.status_code == 200
-        spec = response.json()
-        assert "openapi" in spec
-        assert "paths" in spec
+        return response.json()
+
+    def test_openapi_json_available(self, openapi_spec):
+        """Test OpenAPI JSON is available."""
+        assert "openapi" in openapi_spec
+        assert "paths" in openapi_spec
 
-    def test_openapi_has_all_endpoints(self, client):
+    def test_openapi_has_all_endpoints(self, openapi_spec):
         """Test OpenAPI includes all endpoints."""
-        response = client.get("/openapi.json")
-        spec = response.json()
-        paths = spec["paths"]
+        paths = openapi_spec["paths"]
 
         assert "/health" in paths
         assert "/fonts" in paths
@@ -0,0 +1,44 @@
+"""Pytest fixtures for unit tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """Create one AnimationGenerator shared by the whole session."""
+    from src.core.animation import AnimationGenerator
+
+    return AnimationGenerator()
+
+
+@pytest.fixture(scope="session")
+def test_image():
+    """
+    Create a 256x256 test image with a red square, shared by the whole session.
+
+    Frame generators never modify their input; copy it before writing to it.
+    """
+    import numpy as np
+    from PIL import Image
+
+    arr = np.zeros((256, 256, 4), dtype=np.uint8)
+    arr[100:156, 100:156] = (255, 0, 0, 255)
+    return Image.fromarray(arr, "RGBA")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_font_manager():
+    """
+    Serve PIL's default font from the text module's font manager for the session.
+
+    Only get_font is replaced, so tests that build their own FontManager are
+    unaffected; tests that need other fonts swap get_font again via monkeypatch.
+    """
+    from PIL import ImageFont
+
+    from src.core.text import font_manager
+
+    default_font = ImageFont.load_default()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(font_manager, "get_font", lambda font_id, size: default_font)
+        yield font_manager
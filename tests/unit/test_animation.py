@@ -1,5 +1,8 @@
 """Unit tests for animation generation."""
 
+import math
+
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -70,21 +73,6 @@ class TestMotionConfig:
 class TestAnimationGenerator:
     """Tests for AnimationGenerator class."""
 
-    @pytest.fixture
-    def generator(self):
-        """Create AnimationGenerator instance."""
-        return AnimationGenerator()
-
-    @pytest.fixture
-    def test_image(self):
-        """Create a test image for animation."""
-        img = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
-        # Draw something visible
-        for x in range(100, 156):
-            for y in range(100, 156):
-                img.putpixel((x, y), (255, 0, 0, 255))
-        return img
-
     def test_init_default_values(self, generator):
         """Test default initialization values."""
         assert generator.fps == DEFAULT_FPS
@@ -154,16 +142,14 @@ class TestAnimationGenerator:
         assert all(isinstance(f, Image.Image) for f in frames)
         assert all(f.size == test_image.size for f in frames)
 
-    def test_generate_shake_intensity_affects_amplitude(self, generator, test_image):
+    def test_shake_intensity_affects_amplitude(self, generator):
         """Test shake intensity affects displacement range."""
-        motion_low = MotionConfig(type=MotionType.SHAKE, intensity=Intensity.LOW)
-        motion_high = MotionConfig(type=MotionType.SHAKE, intensity=Intensity.HIGH)
-
-        # Both should generate frames, but with different shake amounts
-        frames_low = generator.generate_frames(test_image, motion_low)
-        frames_high = generator.generate_frames(test_image, motion_high)
+        low = generator._shake_offsets(50, INTENSITY_MULTIPLIERS[Intensity.LOW])
+        high = generator._shake_offsets(50, INTENSITY_MULTIPLIERS[Intensity.HIGH])
 
-        assert len(frames_low) == len(frames_high)
+        assert np.abs(low).max() <= 2
+        assert np.abs(high).max() <= 10
+        assert np.abs(high).max() > np.abs(low).max()
 
     def test_generate_spin_full_rotation(self, generator, test_image):
         """Test spin covers full 360 degrees."""
@@ -174,26 +160,34 @@ class TestAnimationGenerator:
         frames = generator.generate_frames(test_image, motion)
         assert len(frames) == frame_count
 
-    def test_generate_bounce_sine_wave(self, generator, test_image):
-        """Test bounce follows sine wave pattern."""
-        motion = MotionConfig(type=MotionType.BOUNCE)
-        frames = generator.generate_frames(test_image, motion)
+    def test_bounce_offsets_sine_wave(self, generator):
+        """Test bounce follows one period of a sine wave."""
+        offsets = generator._bounce_offsets(20, INTENSITY_MULTIPLIERS[Intensity.MEDIUM])
 
-        # Frames should have varying vertical positions
-        assert len(frames) > 1
+        expected = [int(math.sin((2 * math.pi * i) / 20) * 10) for i in range(20)]
+        assert offsets.shape == (20,)
+        assert offsets.tolist() == expected
 
-    def test_shake_frames_random_displacement(self, generator, test_image):
-        """Test shake frames have random displacement."""
-        MotionConfig(type=MotionType.SHAKE, intensity=Intensity.MEDIUM)
-        frames = generator._generate_shake_frames(
-            test_image, 10, INTENSITY_MULTIPLIERS[Intensity.MEDIUM]
-        )
+    def test_bounce_offsets_pinned(self, generator):
+        """Test bounce offsets match the per-frame math.sin values exactly."""
+        offsets = generator._bounce_offsets(12, INTENSITY_MULTIPLIERS[Intensity.MEDIUM])
 
-        assert len(frames) == 10
-        # All frames should be valid RGBA images
-        for frame in frames:
-            assert frame.mode == "RGBA"
-            assert frame.size == test_image.size
+        assert offsets.tolist() == [0, 4, 8, 10, 8, 4, 0, -4, -8, -10, -8, -5]
+
+    def test_shake_offsets_random_displacement(self, generator):
+        """Test shake offsets are bounded and not constant."""
+        offsets = generator._shake_offsets(10, INTENSITY_MULTIPLIERS[Intensity.MEDIUM])
+
+        assert offsets.shape == (10, 2)
+        assert np.abs(offsets).max() <= 5
+        assert len({tuple(o) for o in offsets}) > 1
+
+    def test_shake_offsets_deterministic(self, generator):
+        """Test shake displacement is reproducible across calls."""
+        first = generator._shake_offsets(5, 1.0)
+        second = generator._shake_offsets(5, 1.0)
+
+        assert np.array_equal(first, second)
 
     def test_spin_frames_rotation(self, generator, test_image):
         """Test spin frames are rotated correctly."""
@@ -204,15 +198,35 @@ class TestAnimationGenerator:
         for frame in frames:
             assert frame.size == test_image.size
 
-    def test_bounce_frames_vertical_offset(self, generator, test_image):
-        """Test bounce frames have vertical offset."""
-        frames = generator._generate_bounce_frames(
-            test_image, 10, INTENSITY_MULTIPLIERS[Intensity.MEDIUM]
-        )
+    def test_spin_frames_match_image_rotate(self, generator, test_image):
+        """Test precomputed spin coefficients match PIL's own rotation."""
+        frames = generator._generate_spin_frames(test_image, 8)
 
-        assert len(frames) == 10
-        for frame in frames:
-            assert frame.size == test_image.size
+        for i, frame in enumerate(frames):
+            expected = test_image.rotate(
+                45 * i,
+                center=(test_image.width // 2, test_image.height // 2),
+                resample=Image.Resampling.BICUBIC,
+            )
+            assert frame.tobytes() == expected.tobytes()
+
+    def test_bounce_offsets_intensity_affects_amplitude(self, generator):
+        """Test bounce amplitude scales with intensity."""
+        low = generator._bounce_offsets(40, INTENSITY_MULTIPLIERS[Intensity.LOW])
+        high = generator._bounce_offsets(40, INTENSITY_MULTIPLIERS[Intensity.HIGH])
+
+        assert np.abs(low).max() <= 5
+        assert np.abs(high).max() == 20
+
+    def test_shift_frames_offsets(self, generator, test_image):
+        """Test shifted frames move content and clip at the canvas edge."""
+        frames = generator._shift_frames(test_image, [0, 10, 0], [-5, 0, 300])
+
+        assert frames[0].getpixel((100, 95)) == (255, 0, 0, 255)
+        assert frames[0].getpixel((100, 151)) == (0, 0, 0, 0)
+        assert frames[1].getpixel((110, 100)) == (255, 0, 0, 255)
+        assert frames[1].getpixel((100, 100)) == (0, 0, 0, 0)
+        assert frames[2].getbbox() is None
 
     def test_gaming_frames_with_callback(self, generator, test_image):
         """Test gaming frames with render callback."""
@@ -230,32 +244,24 @@ class TestAnimationGenerator:
         colors_set = set(callback_calls)
         assert len(colors_set) == 5
 
-    def test_gaming_frames_without_callback(self, generator, test_image):
-        """Test gaming frames without callback uses hue shift."""
-        frames = generator._generate_gaming_frames(
-            test_image,
-            5,
-            "#FF0000",
-            None,  # No callback
-        )
-
-        assert len(frames) == 5
-        for frame in frames:
-            assert frame.size == test_image.size
+    def test_gaming_frames_with_callback_keep_hue_order(self, generator):
+        """Test callback frames come back in hue order."""
 
-    def test_apply_hue_shift(self, generator, test_image):
-        """Test hue shift is applied correctly."""
-        shifted = generator._apply_hue_shift(test_image, 120)
+        def render_callback(color):
+            return Image.new("RGBA", (4, 4), (*color, 255))
 
-        assert shifted.size == test_image.size
-        assert shifted.mode == test_image.mode
+        frames = generator._generate_gaming_frames(None, 3, "#FF0000", render_callback)
 
-    def test_apply_hue_shift_no_visible_pixels(self, generator):
-        """Test hue shift on transparent image."""
-        transparent = Image.new("RGBA", (100, 100), (0, 0, 0, 0))
-        shifted = generator._apply_hue_shift(transparent, 90)
+        assert [f.getpixel((0, 0)) for f in frames] == [
+            (255, 0, 0, 255),
+            (0, 255, 0, 255),
+            (0, 0, 255, 255),
+        ]
 
-        assert shifted.size == transparent.size
+    def test_gaming_frames_without_callback_raises(self, generator, test_image):
+        """Test gaming frames cannot be built without a render callback."""
+        with pytest.raises(ValueError, match="render_callback"):
+            generator._generate_gaming_frames(test_image, 5, "#FF0000", None)
 
     def test_speed_affects_frame_count(self, generator, test_image):
         """Test speed parameter affects frame count."""
@@ -296,12 +302,10 @@ class TestAnimationGeneratorIntegration:
     @pytest.fixture
     def colored_image(self):
         """Create an image with visible content."""
-        img = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
         # Add a colored square in the center
-        for x in range(78, 178):
-            for y in range(78, 178):
-                img.putpixel((x, y), (255, 128, 64, 255))
-        return img
+        arr = np.zeros((256, 256, 4), dtype=np.uint8)
+        arr[78:178, 78:178] = (255, 128, 64, 255)
+        return Image.fromarray(arr, "RGBA")
 
     def test_full_animation_pipeline_shake(self, colored_image):
         """Test full shake animation pipeline."""
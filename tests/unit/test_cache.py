@@ -0,0 +1,55 @@
+"""Unit tests for the LRU cache."""
+
+from src.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Tests for LRUCache class."""
+
+    def test_get_missing_returns_none(self):
+        """Test missing keys return None and count as misses."""
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+
+    def test_put_and_get(self):
+        """Test stored values are returned and count as hits."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_maxsize_disables_cache(self):
+        """Test maxsize 0 never stores entries."""
+        cache = LRUCache(maxsize=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Test clear removes entries and resets counters."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
@@ -41,19 +41,17 @@ class TestHexToRgb:
         assert hex_to_rgb("FF0000") == (255, 0, 0)
         assert hex_to_rgb("abc") == (170, 187, 204)
 
-    def test_invalid_hex_length(self):
+    @pytest.mark.parametrize("hex_color", ["#FF00", "#FF00001"])
+    def test_invalid_hex_length(self, hex_color):
         """Test invalid hex color length raises ValueError."""
         with pytest.raises(ValueError, match="Invalid hex color"):
-            hex_to_rgb("#FF00")
-        with pytest.raises(ValueError, match="Invalid hex color"):
-            hex_to_rgb("#FF00001")
+            hex_to_rgb(hex_color)
 
-    def test_invalid_hex_characters(self):
+    @pytest.mark.parametrize("hex_color", ["#GGGGGG", "#XYZ123", "#FF 000", "#F_F"])
+    def test_invalid_hex_characters(self, hex_color):
         """Test invalid hex characters raise ValueError."""
         with pytest.raises(ValueError, match="Invalid hex color"):
-            hex_to_rgb("#GGGGGG")
-        with pytest.raises(ValueError, match="Invalid hex color"):
-            hex_to_rgb("#XYZ123")
+            hex_to_rgb(hex_color)
 
 
 class TestRgbToHex:
@@ -201,6 +199,15 @@ class TestRotateHue:
         assert g == 0
         assert b == 255
 
+    def test_whole_turns_return_input_exactly(self):
+        """Test multiples of 360 degrees leave any color untouched."""
+        assert rotate_hue(30, 30, 100, 0) == (30, 30, 100)
+        assert rotate_hue(30, 30, 100, 720) == (30, 30, 100)
+
+    def test_gray_is_unchanged(self):
+        """Test rotating a gray leaves it gray."""
+        assert rotate_hue(128, 128, 128, 90) == (128, 128, 128)
+
 
 class TestValidateHexColor:
     """Tests for validate_hex_color function."""
@@ -230,6 +237,21 @@ class TestValidateHexColor:
         """Test invalid hex characters."""
         assert validate_hex_color("#GGGGGG") is False
         assert validate_hex_color("#XYZ") is False
+        assert validate_hex_color("#FF_000") is False
+        assert validate_hex_color("# F0000") is False
+        assert validate_hex_color("#FF0000\n") is False
+
+    def test_repeated_calls_are_cached(self):
+        """Test repeated validation of the same string is a cache hit."""
+        validate_hex_color("#C0FFEE")
+        hits = validate_hex_color.cache_info().hits
+
+        assert validate_hex_color("#C0FFEE") is True
+        assert validate_hex_color.cache_info().hits == hits + 1
+
+    def test_empty_string(self):
+        """Test empty string is invalid."""
+        assert validate_hex_color("") is False
 
 
 class TestRoundTrip:
@@ -250,11 +272,10 @@ class TestRoundTrip:
             (0, 0, 255),
             (128, 64, 32),
             (200, 100, 150),
+            (30, 30, 100),
+            (0, 0, 10),
         ]
         for original in test_colors:
             h, s, lightness = rgb_to_hsl(*original)
             result = hsl_to_rgb(h, s, lightness)
-            # Allow small rounding errors
-            assert abs(result[0] - original[0]) <= 1
-            assert abs(result[1] - original[1]) <= 1
-            assert abs(result[2] - original[2]) <= 1
+            assert result == original
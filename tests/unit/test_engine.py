@@ -1,12 +1,14 @@
 """Unit tests for rendering engine."""
 
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
 from PIL import Image
 
 from src.core.animation import MotionConfig, MotionType
-from src.core.engine import RenderingEngine, RenderResult
+from src.core.engine import RenderingEngine, RenderResult, _compress_frame
+from src.core.fonts import FontManager
 from src.core.text import LayoutConfig, TextStyle
 
 
@@ -26,14 +28,14 @@ class TestRenderResult:
 class TestRenderingEngine:
     """Tests for RenderingEngine class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def style(self):
-        """Create a test style."""
+        """Create a test style; configs are frozen, so the class shares one."""
         return TextStyle(font_id="test_font", text_color="#FF0000")
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def layout(self):
-        """Create a test layout."""
+        """Create a test layout; configs are frozen, so the class shares one."""
         return LayoutConfig(mode="square", alignment="center")
 
     @pytest.fixture
@@ -47,6 +49,11 @@ class TestRenderingEngine:
         assert engine.text_renderer is not None
         assert engine.animation_generator is not None
 
+    def test_every_motion_type_has_frame_generator(self):
+        """Test frame generator dispatch covers all motion types."""
+        engine = RenderingEngine()
+        assert set(engine._frame_generators) == set(MotionType)
+
     def test_render_static_image(self, style, layout, test_image):
         """Test rendering a static (non-animated) image."""
         engine = RenderingEngine()
@@ -78,7 +85,7 @@ class TestRenderingEngine:
 
             result = engine.render("Test", style, layout, motion)
 
-        assert result.format == "apng"
+        assert result.format == "webp"
 
     def test_render_animated_spin(self, style, layout, test_image):
         """Test rendering spin animation."""
@@ -94,7 +101,7 @@ class TestRenderingEngine:
 
             result = engine.render("Test", style, layout, motion)
 
-        assert result.format == "apng"
+        assert result.format == "webp"
 
     def test_render_animated_bounce(self, style, layout, test_image):
         """Test rendering bounce animation."""
@@ -110,7 +117,7 @@ class TestRenderingEngine:
 
             result = engine.render("Test", style, layout, motion)
 
-        assert result.format == "apng"
+        assert result.format == "webp"
 
     def test_render_animated_gaming(self, style, layout, test_image):
         """Test rendering gaming (rainbow) animation."""
@@ -126,7 +133,28 @@ class TestRenderingEngine:
 
             result = engine.render("Test", style, layout, motion)
 
+        assert result.format == "webp"
+
+    def test_render_animation_as_apng_when_configured(self, style, layout, test_image):
+        """Test animations are encoded as APNG when ANIMATION_FORMAT is apng."""
+        engine = RenderingEngine()
+        motion = MotionConfig(type=MotionType.SHAKE)
+
+        with (
+            patch("src.core.engine.font_manager") as mock_fm,
+            patch("src.core.engine.settings") as mock_settings,
+        ):
+            mock_fm.font_exists.return_value = True
+            mock_settings.animation_format = "apng"
+            engine.text_renderer = MagicMock()
+            engine.text_renderer.render_text.return_value = test_image
+            engine.animation_generator = MagicMock()
+            engine.animation_generator.generate_frames.return_value = [test_image] * 5
+
+            result = engine.render("Test", style, layout, motion)
+
         assert result.format == "apng"
+        assert result.data[:8] == b"\x89PNG\r\n\x1a\n"
 
     def test_render_font_not_found(self, style, layout):
         """Test error when font not found."""
@@ -152,6 +180,55 @@ class TestRenderingEngine:
         assert data[:4] == b"RIFF"
         assert data[8:12] == b"WEBP"
 
+    def test_encode_webp_is_lossless(self):
+        """Test WebP output round-trips pixels exactly."""
+        engine = RenderingEngine()
+        image = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+        image.paste((12, 200, 99, 180), (8, 8, 40, 40))
+
+        data = engine._encode_webp(image)
+
+        assert data[12:16] == b"VP8L"
+        assert Image.open(io.BytesIO(data)).tobytes() == image.tobytes()
+
+    def test_encode_webp_uses_configured_effort(self):
+        """Test WebP method and quality come from settings."""
+        engine = RenderingEngine()
+        image = Image.new("RGBA", (16, 16), (255, 0, 0, 255))
+
+        with (
+            patch("src.core.engine.settings") as mock_settings,
+            patch.object(image, "save") as mock_save,
+        ):
+            mock_settings.webp_method = 4
+            mock_settings.webp_quality = 75
+            engine._encode_webp(image)
+
+        assert mock_save.call_args.kwargs["method"] == 4
+        assert mock_save.call_args.kwargs["quality"] == 75
+
+    def test_encode_animated_webp_round_trips_frames(self):
+        """Test animated WebP frames decode back to the input pixels."""
+        engine = RenderingEngine()
+        frames = [Image.new("RGBA", (32, 32), (0, 0, 0, 0)) for _ in range(3)]
+        for i, frame in enumerate(frames):
+            frame.paste((255, 80 * i, 0, 200), (i * 8, 4, i * 8 + 8, 12))
+
+        data = engine._encode_animated_webp(frames)
+
+        with Image.open(io.BytesIO(data)) as webp:
+            assert webp.n_frames == 3
+            assert webp.info["loop"] == 0
+            for i, frame in enumerate(frames):
+                webp.seek(i)
+                assert webp.convert("RGBA").tobytes() == frame.tobytes()
+
+    def test_encode_animated_webp_empty_frames(self):
+        """Test animated WebP encoding with empty frames list raises error."""
+        engine = RenderingEngine()
+        with pytest.raises(ValueError, match="No frames to encode"):
+            engine._encode_animated_webp([])
+
     def test_encode_apng_single_frame(self):
         """Test APNG encoding with single frame."""
         engine = RenderingEngine()
@@ -180,6 +257,40 @@ class TestRenderingEngine:
         # Check PNG magic bytes
         assert data[:8] == b"\x89PNG\r\n\x1a\n"
 
+    def test_encode_apng_round_trips_frames(self):
+        """Test stitched APNG frames decode back to the input pixels."""
+        engine = RenderingEngine()
+        frames = [Image.new("RGBA", (32, 32), (0, 0, 0, 0)) for _ in range(3)]
+        for i, frame in enumerate(frames):
+            frame.paste((255, 80 * i, 0, 200), (i * 8, 4, i * 8 + 8, 12))
+
+        data = engine._encode_apng(frames)
+
+        with Image.open(io.BytesIO(data)) as apng:
+            assert apng.n_frames == 3
+            assert apng.info["loop"] == 0
+            for i, frame in enumerate(frames):
+                apng.seek(i)
+                assert apng.info["duration"] == 50
+                assert apng.convert("RGBA").tobytes() == frame.tobytes()
+
+    def test_encode_apng_compresses_repeated_frames_once(self):
+        """Test identical frames share one compression and still decode in order."""
+        engine = RenderingEngine()
+        red = Image.new("RGBA", (16, 16), (255, 0, 0, 255))
+        blue = Image.new("RGBA", (16, 16), (0, 0, 255, 255))
+        frames = [red, blue, red.copy(), blue]
+
+        with patch("src.core.engine._compress_frame", wraps=_compress_frame) as compress:
+            data = engine._encode_apng(frames)
+
+        assert compress.call_count == 2
+        with Image.open(io.BytesIO(data)) as apng:
+            assert apng.n_frames == 4
+            for i, frame in enumerate(frames):
+                apng.seek(i)
+                assert apng.convert("RGBA").tobytes() == frame.tobytes()
+
     def test_encode_apng_empty_frames(self):
         """Test APNG encoding with empty frames list raises error."""
         engine = RenderingEngine()
@@ -228,6 +339,32 @@ class TestRenderingEngine:
         assert isinstance(frames, list)
         assert len(frames) == 5
 
+    def test_generate_gaming_frames_recolors_fill(self, style, layout):
+        """Test gaming frames recolor the fill from a black and a white render."""
+        engine = RenderingEngine()
+        motion = MotionConfig(type=MotionType.GAMING, speed=1.0)
+
+        def render_text(text, style, layout, custom_text_color=None):
+            image = Image.new("RGBA", (8, 8), (0, 0, 255, 255))  # outline-colored background
+            image.putpixel((0, 0), (*custom_text_color, 255))  # fully covered fill pixel
+            return image
+
+        engine.text_renderer = MagicMock()
+        engine.text_renderer.render_text.side_effect = render_text
+        engine.animation_generator = MagicMock()
+        engine.animation_generator.get_frame_count.return_value = 3
+
+        frames = engine._generate_gaming_frames("Test", style, layout, motion)
+
+        assert engine.text_renderer.render_text.call_count == 2
+        assert [f.getpixel((0, 0)) for f in frames] == [
+            (255, 0, 0, 255),
+            (0, 255, 0, 255),
+            (0, 0, 255, 255),
+        ]
+        # Pixels outside the fill keep their color in every frame
+        assert all(f.getpixel((4, 4)) == (0, 0, 255, 255) for f in frames)
+
     def test_render_returns_timing_info(self, style, layout, test_image):
         """Test render returns timing information."""
         engine = RenderingEngine()
@@ -249,8 +386,6 @@ class TestRenderingEngineIntegration:
     @pytest.fixture
     def setup_fonts(self, tmp_path):
         """Setup font manager with a test font."""
-        from src.core.fonts import FontManager
-
         # Reset singleton
         FontManager._instance = None
         manager = FontManager()
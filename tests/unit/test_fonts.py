@@ -1,10 +1,14 @@
 """Unit tests for font management."""
 
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, patch
 
 import pytest
 from PIL import ImageFont
 
+from src.core.fonts import PRELOAD_FONT_SIZES, FontInfo, FontManager
+from src.core.text import _fit_square_font_size, _measure_text
+
 
 class TestFontManager:
     """Tests for FontManager class."""
@@ -13,8 +17,6 @@ class TestFontManager:
     def font_manager(self):
         """Create a fresh FontManager instance for testing."""
         # Reset singleton for testing
-        from src.core.fonts import FontManager
-
         FontManager._instance = None
         manager = FontManager()
         return manager
@@ -27,8 +29,6 @@ class TestFontManager:
 
     def test_singleton_pattern(self):
         """Test that FontManager follows singleton pattern."""
-        from src.core.fonts import FontManager
-
         FontManager._instance = None
 
         manager1 = FontManager()
@@ -41,6 +41,7 @@ class TestFontManager:
         assert font_manager._generate_font_id("My-Font-Name") == "my_font_name"
         assert font_manager._generate_font_id("UPPERCASE") == "uppercase"
         assert font_manager._generate_font_id("with__double") == "with_double"
+        assert font_manager._generate_font_id("Mixed - _Separators") == "mixed_separators"
 
     def test_generate_font_name(self, font_manager):
         """Test human-readable font name generation."""
@@ -60,6 +61,10 @@ class TestFontManager:
         assert "sans-serif" in categories
         assert "serif" not in categories
 
+    def test_detect_categories_sans_wins_over_serif(self, font_manager):
+        """Test a name containing both sans and serif is only sans-serif."""
+        assert font_manager._detect_categories("SourceSansSerif") == ["sans-serif"]
+
     def test_detect_categories_handwritten(self, font_manager):
         """Test handwritten category detection."""
         categories = font_manager._detect_categories("Beautiful-Handwriting")
@@ -68,6 +73,10 @@ class TestFontManager:
         categories = font_manager._detect_categories("Cursive-Script")
         assert "handwritten" in categories
 
+    def test_detect_categories_overlapping_keywords(self, font_manager):
+        """Test keywords sharing letters are each detected."""
+        assert font_manager._detect_categories("Sanscript") == ["sans-serif", "handwritten"]
+
     def test_detect_categories_display(self, font_manager):
         """Test display category detection."""
         categories = font_manager._detect_categories("Fancy-Display-Font")
@@ -121,6 +130,7 @@ class TestFontManager:
             assert info is not None
             assert info.id == "testfont"
             assert info.name == "Testfont"
+            assert info.categories == ("sans-serif",)
 
     def test_initialize_supports_multiple_extensions(self, font_manager, tmp_path):
         """Test initialize supports various font file extensions."""
@@ -137,6 +147,62 @@ class TestFontManager:
             fonts = font_manager.list_fonts()
             assert len(fonts) >= len(extensions)
 
+    def test_initialize_preloads_common_sizes(self, font_manager, tmp_path):
+        """Test initialize opens each font at the preload sizes."""
+        (tmp_path / "Preload.ttf").write_bytes(b"dummy font data")
+
+        with patch.object(ImageFont, "truetype", return_value=MagicMock()) as mock_truetype:
+            font_manager.initialize(str(tmp_path))
+
+            sizes = sorted(c[1]["size"] for c in mock_truetype.call_args_list)
+            assert sizes == sorted(PRELOAD_FONT_SIZES)
+
+            font_manager.get_font("preload", 32)
+            assert mock_truetype.call_count == len(PRELOAD_FONT_SIZES)
+
+    def test_initialize_skips_unloadable_font_preload(self, font_manager, tmp_path):
+        """Test a font that fails to preload is still registered."""
+        (tmp_path / "Broken.ttf").write_bytes(b"not a font")
+
+        font_manager.initialize(str(tmp_path))
+
+        assert font_manager.font_exists("broken")
+
+    def test_fingerprint_tracks_font_files(self, font_manager, tmp_path):
+        """Test the fingerprint changes when a font file is replaced."""
+        font_file = tmp_path / "Print.ttf"
+        font_file.write_bytes(b"dummy font data")
+        assert font_manager.fingerprint() == ""
+
+        with patch.object(ImageFont, "truetype", return_value=MagicMock()):
+            font_manager.initialize(str(tmp_path))
+            before = font_manager.fingerprint()
+            font_manager.initialize(str(tmp_path))
+            assert font_manager.fingerprint() == before
+
+            font_file.write_bytes(b"other font data!")
+            font_manager.initialize(str(tmp_path))
+
+        assert before
+        assert font_manager.fingerprint() != before
+
+    def test_initialize_drops_stale_font_caches(self, font_manager, tmp_path):
+        """Test reinitializing forgets faces and text measurements of replaced fonts."""
+        (tmp_path / "Stale.ttf").write_bytes(b"dummy font data")
+        _measure_text("A", "stale", 10)
+        _fit_square_font_size("A", "stale", 256, 0)
+
+        with patch.object(ImageFont, "truetype", return_value=MagicMock()) as mock_truetype:
+            font_manager.initialize(str(tmp_path))
+            font_manager.get_font("stale", 10)
+            (tmp_path / "Stale.ttf").write_bytes(b"replaced font data")
+            font_manager.initialize(str(tmp_path))
+            font_manager.get_font("stale", 10)
+
+        assert mock_truetype.call_count == 2 * (len(PRELOAD_FONT_SIZES) + 1)
+        assert _measure_text.cache_info().currsize == 0
+        assert _fit_square_font_size.cache_info().currsize == 0
+
     def test_get_font_caching(self, font_manager, tmp_path):
         """Test font loading is cached."""
         # Create a font file
@@ -161,19 +227,48 @@ class TestFontManager:
             calls = [c for c in mock_truetype.call_args_list if c[1].get("size") == 64]
             assert len(calls) == 1
 
+    def test_get_font_cache_is_bounded(self, font_manager, tmp_path):
+        """Test the least recently used font is evicted once the cache is full."""
+        (tmp_path / "Bounded.ttf").write_bytes(b"dummy font data")
+
+        with patch.object(ImageFont, "truetype", side_effect=lambda *a, **k: MagicMock()):
+            font_manager.initialize(str(tmp_path))
+            font_manager._font_cache.clear()
+            font_manager._font_cache.maxsize = 2
+
+            first = font_manager.get_font("bounded", 10)
+            font_manager.get_font("bounded", 11)
+            font_manager.get_font("bounded", 12)
+
+            assert len(font_manager._font_cache) == 2
+            assert font_manager.get_font("bounded", 10) is not first
+
 
 class TestFontInfo:
     """Tests for FontInfo dataclass."""
 
     def test_font_info_creation(self):
         """Test FontInfo dataclass creation."""
-        from src.core.fonts import FontInfo
-
         info = FontInfo(
-            id="test_font", name="Test Font", path="/path/to/font.ttf", categories=["sans-serif"]
+            id="test_font", name="Test Font", path="/path/to/font.ttf", categories=("sans-serif",)
         )
 
         assert info.id == "test_font"
         assert info.name == "Test Font"
         assert info.path == "/path/to/font.ttf"
-        assert info.categories == ["sans-serif"]
+        assert info.categories == ("sans-serif",)
+
+    def test_font_info_is_hashable(self):
+        """Test equal FontInfo values hash alike and can key a dict."""
+        info = FontInfo(
+            id="test_font", name="Test Font", path="/path/to/font.ttf", categories=("serif",)
+        )
+        same = FontInfo(
+            id="test_font", name="Test Font", path="/path/to/font.ttf", categories=("serif",)
+        )
+
+        assert hash(info) == hash(same)
+        assert {info: "loaded"}[same] == "loaded"
+        with pytest.raises(FrozenInstanceError):
+            info.name = "Other"
+        assert not hasattr(info, "__dict__")
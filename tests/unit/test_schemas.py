@@ -13,6 +13,21 @@ from src.api.schemas import (
     RenderRequest,
     StyleSchema,
 )
+from src.config import settings
+
+VALID_HEX_COLORS = ["#FF0000", "#ff0000", "#F00", "#abc", "#ABCDEF", "#abcdef"]
+INVALID_HEX_COLORS = ["FF0000", "#GGGGGG", "#12345", "#FF00", "red", "#1234567"]
+
+# Texts exactly at and one past the configured length limit
+_MAX_TEXT = "a" * settings.max_text_length
+_OVER_MAX_TEXT = _MAX_TEXT + "a"
+
+
+def _style(**overrides) -> StyleSchema:
+    """Build a StyleSchema without validation, for tests that do not exercise it."""
+    return StyleSchema.model_construct(
+        **{"fontId": "test_font", "textColor": "#FF0000", **overrides}
+    )
 
 
 class TestLayoutSchema:
@@ -24,22 +39,22 @@ class TestLayoutSchema:
         assert layout.mode == "square"
         assert layout.alignment == "center"
 
-    def test_valid_modes(self):
+    @pytest.mark.parametrize("mode", ["square", "banner"])
+    def test_valid_modes(self, mode):
         """Test valid layout modes."""
-        for mode in ["square", "banner"]:
-            layout = LayoutSchema(mode=mode)  # type: ignore[arg-type]
-            assert layout.mode == mode
+        layout = LayoutSchema(mode=mode)
+        assert layout.mode == mode
 
     def test_invalid_mode(self):
         """Test invalid layout mode raises error."""
         with pytest.raises(ValidationError):
             LayoutSchema(mode="invalid")  # type: ignore[arg-type]
 
-    def test_valid_alignments(self):
+    @pytest.mark.parametrize("alignment", ["left", "center", "right"])
+    def test_valid_alignments(self, alignment):
         """Test valid alignment values."""
-        for alignment in ["left", "center", "right"]:
-            layout = LayoutSchema(alignment=alignment)  # type: ignore[arg-type]
-            assert layout.alignment == alignment
+        layout = LayoutSchema(alignment=alignment)
+        assert layout.alignment == alignment
 
     def test_invalid_alignment(self):
         """Test invalid alignment raises error."""
@@ -68,34 +83,29 @@ class TestStyleSchema:
         assert style.outlineWidth == 0
         assert style.shadow is False
 
-    def test_valid_hex_colors(self):
+    @pytest.mark.parametrize("color", VALID_HEX_COLORS)
+    def test_valid_hex_colors(self, color):
         """Test valid hex color formats."""
-        valid_colors = ["#FF0000", "#ff0000", "#F00", "#abc", "#ABCDEF"]
-        for color in valid_colors:
-            style = StyleSchema(fontId="font", textColor=color)
-            assert style.textColor == color
+        style = StyleSchema(fontId="font", textColor=color)
+        assert style.textColor == color
 
-    def test_invalid_hex_colors(self):
+    @pytest.mark.parametrize("color", INVALID_HEX_COLORS)
+    def test_invalid_hex_colors(self, color):
         """Test invalid hex colors raise error."""
-        invalid_colors = ["FF0000", "#GGGGGG", "#12345", "red", "#1234567"]
-        for color in invalid_colors:
-            with pytest.raises(ValidationError):
-                StyleSchema(fontId="font", textColor=color)
-
-    def test_outline_width_range(self):
-        """Test outline width validation."""
-        # Valid range
-        for width in [0, 10, 20]:
-            style = StyleSchema(fontId="font", textColor="#FFF", outlineWidth=width)
-            assert style.outlineWidth == width
-
-        # Invalid: below minimum
         with pytest.raises(ValidationError):
-            StyleSchema(fontId="font", textColor="#FFF", outlineWidth=-1)
+            StyleSchema(fontId="font", textColor=color)
 
-        # Invalid: above maximum
+    @pytest.mark.parametrize("width", [0, 10, 20])
+    def test_outline_width_range(self, width):
+        """Test outline widths within range are accepted."""
+        style = StyleSchema(fontId="font", textColor="#FFF", outlineWidth=width)
+        assert style.outlineWidth == width
+
+    @pytest.mark.parametrize("width", [-1, 21])
+    def test_outline_width_out_of_range(self, width):
+        """Test outline widths outside 0-20 raise error."""
         with pytest.raises(ValidationError):
-            StyleSchema(fontId="font", textColor="#FFF", outlineWidth=21)
+            StyleSchema(fontId="font", textColor="#FFF", outlineWidth=width)
 
     def test_outline_color_validation(self):
         """Test outline color is validated."""
@@ -113,42 +123,39 @@ class TestMotionSchema:
         assert motion.intensity == "medium"
         assert motion.speed == 1.0
 
-    def test_valid_motion_types(self):
+    @pytest.mark.parametrize("motion_type", ["none", "shake", "spin", "bounce", "gaming"])
+    def test_valid_motion_types(self, motion_type):
         """Test valid motion types."""
-        for motion_type in ["none", "shake", "spin", "bounce", "gaming"]:
-            motion = MotionSchema(type=motion_type)  # type: ignore[arg-type]
-            assert motion.type == motion_type
+        motion = MotionSchema(type=motion_type)
+        assert motion.type == motion_type
 
     def test_invalid_motion_type(self):
         """Test invalid motion type raises error."""
         with pytest.raises(ValidationError):
             MotionSchema(type="invalid")  # type: ignore[arg-type]
 
-    def test_valid_intensity_levels(self):
+    @pytest.mark.parametrize("intensity", ["low", "medium", "high"])
+    def test_valid_intensity_levels(self, intensity):
         """Test valid intensity levels."""
-        for intensity in ["low", "medium", "high"]:
-            motion = MotionSchema(intensity=intensity)  # type: ignore[arg-type]
-            assert motion.intensity == intensity
+        motion = MotionSchema(intensity=intensity)
+        assert motion.intensity == intensity
 
     def test_invalid_intensity(self):
         """Test invalid intensity raises error."""
         with pytest.raises(ValidationError):
             MotionSchema(intensity="invalid")  # type: ignore[arg-type]
 
-    def test_speed_range(self):
-        """Test speed validation range."""
-        # Valid range
-        for speed in [0.1, 1.0, 2.5, 5.0]:
-            motion = MotionSchema(speed=speed)
-            assert motion.speed == speed
-
-        # Invalid: below minimum
-        with pytest.raises(ValidationError):
-            MotionSchema(speed=0.05)
+    @pytest.mark.parametrize("speed", [0.1, 1.0, 2.5, 5.0])
+    def test_speed_range(self, speed):
+        """Test speeds within range are accepted."""
+        motion = MotionSchema(speed=speed)
+        assert motion.speed == speed
 
-        # Invalid: above maximum
+    @pytest.mark.parametrize("speed", [0.05, 5.5])
+    def test_speed_out_of_range(self, speed):
+        """Test speeds outside 0.1-5.0 raise error."""
         with pytest.raises(ValidationError):
-            MotionSchema(speed=5.5)
+            MotionSchema(speed=speed)
 
 
 class TestRenderRequest:
@@ -157,7 +164,12 @@ class TestRenderRequest:
     @pytest.fixture
     def valid_style(self):
         """Create a valid style for testing."""
-        return StyleSchema(fontId="test_font", textColor="#FF0000")
+        return _style()
+
+    @pytest.fixture(scope="class")
+    def prototype(self):
+        """Validate one minimal request for the class to share."""
+        return RenderRequest(text="Test", style=_style())
 
     def test_required_fields(self, valid_style):
         """Test required fields."""
@@ -165,41 +177,30 @@ class TestRenderRequest:
         assert request.text == "Test"
         assert request.style == valid_style
 
-    def test_default_layout(self, valid_style):
+    def test_default_layout(self, prototype):
         """Test default layout is applied."""
-        request = RenderRequest(text="Test", style=valid_style)
-        assert request.layout.mode == "square"
-        assert request.layout.alignment == "center"
+        assert prototype.layout.mode == "square"
+        assert prototype.layout.alignment == "center"
 
-    def test_default_motion(self, valid_style):
+    def test_default_motion(self, prototype):
         """Test default motion is applied."""
-        request = RenderRequest(text="Test", style=valid_style)
-        assert request.motion.type == "none"
-
-    def test_empty_text_rejected(self, valid_style):
-        """Test empty text is rejected."""
-        with pytest.raises(ValidationError):
-            RenderRequest(text="", style=valid_style)
+        assert prototype.motion.type == "none"
 
-    def test_whitespace_only_text_rejected(self, valid_style):
-        """Test whitespace-only text is rejected."""
+    @pytest.mark.parametrize("text", ["", "   "], ids=["empty", "whitespace-only"])
+    def test_blank_text_rejected(self, valid_style, text):
+        """Test empty and whitespace-only text is rejected."""
         with pytest.raises(ValidationError):
-            RenderRequest(text="   ", style=valid_style)
+            RenderRequest(text=text, style=valid_style)
 
     def test_text_length_limit(self, valid_style):
         """Test text length limit."""
-        # Get the max length from settings
-        from src.config import settings
-
-        max_len = settings.max_text_length
-
         # Valid: at limit
-        request = RenderRequest(text="a" * max_len, style=valid_style)
-        assert len(request.text) == max_len
+        request = RenderRequest(text=_MAX_TEXT, style=valid_style)
+        assert len(request.text) == settings.max_text_length
 
         # Invalid: exceeds limit
         with pytest.raises(ValidationError):
-            RenderRequest(text="a" * (max_len + 1), style=valid_style)
+            RenderRequest(text=_OVER_MAX_TEXT, style=valid_style)
 
     def test_multiline_text(self, valid_style):
         """Test multiline text is accepted."""
@@ -210,15 +211,9 @@ class TestRenderRequest:
         """Test full request with all fields."""
         request = RenderRequest(
             text="Test",
-            layout=LayoutSchema(mode="banner", alignment="left"),
-            style=StyleSchema(
-                fontId="font",
-                textColor="#FF0000",
-                outlineColor="#000000",
-                outlineWidth=5,
-                shadow=True,
-            ),
-            motion=MotionSchema(type="shake", intensity="high", speed=2.0),
+            layout=LayoutSchema.model_construct(mode="banner", alignment="left"),
+            style=_style(fontId="font", outlineColor="#000000", outlineWidth=5, shadow=True),
+            motion=MotionSchema.model_construct(type="shake", intensity="high", speed=2.0),
         )
         assert request.layout.mode == "banner"
         assert request.style.outlineWidth == 5
@@ -283,30 +278,12 @@ class TestErrorResponse:
 class TestHexColorPattern:
     """Tests for HEX color regex pattern."""
 
-    def test_valid_six_char_uppercase(self):
-        """Test valid 6-char uppercase hex."""
-        assert HEX_COLOR_PATTERN.match("#FF0000") is not None
-        assert HEX_COLOR_PATTERN.match("#ABCDEF") is not None
-
-    def test_valid_six_char_lowercase(self):
-        """Test valid 6-char lowercase hex."""
-        assert HEX_COLOR_PATTERN.match("#ff0000") is not None
-        assert HEX_COLOR_PATTERN.match("#abcdef") is not None
-
-    def test_valid_three_char(self):
-        """Test valid 3-char hex."""
-        assert HEX_COLOR_PATTERN.match("#FFF") is not None
-        assert HEX_COLOR_PATTERN.match("#abc") is not None
-
-    def test_invalid_no_hash(self):
-        """Test invalid hex without hash."""
-        assert HEX_COLOR_PATTERN.match("FF0000") is None
-
-    def test_invalid_length(self):
-        """Test invalid length."""
-        assert HEX_COLOR_PATTERN.match("#FF00") is None
-        assert HEX_COLOR_PATTERN.match("#FF00001") is None
-
-    def test_invalid_chars(self):
-        """Test invalid characters."""
-        assert HEX_COLOR_PATTERN.match("#GGGGGG") is None
+    @pytest.mark.parametrize("color", VALID_HEX_COLORS)
+    def test_valid(self, color):
+        """Test 3- and 6-digit hex colors in either case match."""
+        assert HEX_COLOR_PATTERN.match(color) is not None
+
+    @pytest.mark.parametrize("color", INVALID_HEX_COLORS)
+    def test_invalid(self, color):
+        """Test missing hash, wrong length and non-hex characters do not match."""
+        assert HEX_COLOR_PATTERN.match(color) is None
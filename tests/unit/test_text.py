@@ -1,6 +1,7 @@
 """Unit tests for text rendering."""
 
-from unittest.mock import patch
+from dataclasses import replace
+from functools import cache
 
 import pytest
 from PIL import Image, ImageFont
@@ -16,6 +17,21 @@ from src.core.text import (
     TextStyle,
 )
 
+# Bitmap font shared by every test that does not need a specific size
+_DEFAULT_FONT = ImageFont.load_default()
+
+# Canonical configs shared by the render_text cases; they are frozen, so safe to reuse
+_RED = TextStyle(font_id="test_font", text_color="#FF0000")
+_OUTLINED = replace(_RED, outline_color="#000000", outline_width=3)
+_SHADOWED = replace(_RED, shadow=True)
+_LAYOUT = LayoutConfig()
+
+
+@cache
+def _sized_default_font(size: int) -> ImageFont.FreeTypeFont:
+    """Load the default font at a given size once per session."""
+    return ImageFont.load_default(size)
+
 
 class TestTextStyle:
     """Tests for TextStyle dataclass."""
@@ -62,206 +78,133 @@ class TestLayoutConfig:
 class TestTextRenderer:
     """Tests for TextRenderer class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def renderer(self):
-        """Create TextRenderer instance."""
+        """Create one TextRenderer shared by the whole session."""
         return TextRenderer()
 
+    @pytest.fixture(scope="class")
+    def square_sizes(self, renderer):
+        """Fit "Test" to the square canvas once per outline width."""
+        return {
+            outline: renderer.calculate_font_size_for_square(
+                "Test", "test_font", SQUARE_SIZE, outline
+            )
+            for outline in (0, 10)
+        }
+
     def test_get_multiline_bbox_single_line(self, renderer):
         """Test bounding box calculation for single line text."""
-        # Use a real default font for testing
-        default_font = ImageFont.load_default()
-
-        bbox = renderer._get_multiline_bbox("Test", default_font)
+        bbox = renderer._get_multiline_bbox("Test", _DEFAULT_FONT)
         assert isinstance(bbox, tuple)
         assert len(bbox) == 4
         # bbox should be (left, top, right, bottom)
         assert bbox[2] > bbox[0]  # width > 0
         assert bbox[3] >= bbox[1]  # height >= 0
 
-    def test_calculate_font_size_for_square_basic(self, renderer):
+    def test_calculate_font_size_for_square_basic(self, square_sizes):
         """Test font size calculation returns valid size."""
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            size = renderer.calculate_font_size_for_square("Test", "test_font", SQUARE_SIZE, 0)
-            assert MIN_FONT_SIZE <= size <= MAX_FONT_SIZE
+        assert MIN_FONT_SIZE <= square_sizes[0] <= MAX_FONT_SIZE
 
-    def test_calculate_font_size_accounts_for_outline(self, renderer):
+    def test_calculate_font_size_accounts_for_outline(self, square_sizes):
         """Test font size calculation accounts for outline width."""
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
+        # With outline, available space is less, so font should be same or smaller
+        assert square_sizes[10] <= square_sizes[0]
+
+    def test_calculate_font_size_for_square_memoized(
+        self, renderer, stub_font_manager, monkeypatch
+    ):
+        """Test repeated font size calculations reuse the fitted result."""
+        requested = []
+
+        def get_font(font_id, size):
+            requested.append(size)
+            return _DEFAULT_FONT
+
+        monkeypatch.setattr(stub_font_manager, "get_font", get_font)
+
+        first = renderer.calculate_font_size_for_square("Test", "test_font", SQUARE_SIZE, 0)
+        calls = len(requested)
+        second = renderer.calculate_font_size_for_square("Test", "test_font", SQUARE_SIZE, 0)
+
+        assert first == second
+        assert len(requested) == calls
+
+    @pytest.mark.parametrize("text", ["A", "Test", "Longer text", "Two\nlines"])
+    def test_calculate_font_size_for_square_is_largest_fit(
+        self, renderer, stub_font_manager, monkeypatch, text
+    ):
+        """Test the fitted size is the largest size whose text fits."""
+        monkeypatch.setattr(
+            stub_font_manager, "get_font", lambda font_id, size: _sized_default_font(size)
+        )
 
-            size_no_outline = renderer.calculate_font_size_for_square(
-                "Test", "test_font", SQUARE_SIZE, 0
-            )
+        size = renderer.calculate_font_size_for_square(text, "test_font", SQUARE_SIZE, 4)
 
-            size_with_outline = renderer.calculate_font_size_for_square(
-                "Test", "test_font", SQUARE_SIZE, 10
-            )
+        def fits(s):
+            bbox = renderer._get_multiline_bbox(text, _sized_default_font(s))
+            available = SQUARE_SIZE - 2 * PADDING - 2 * 4
+            return bbox[2] - bbox[0] <= available and bbox[3] - bbox[1] <= available
 
-            # With outline, available space is less, so font should be same or smaller
-            assert size_with_outline <= size_no_outline
+        assert fits(size)
+        assert size == MAX_FONT_SIZE or not fits(size + 1)
 
     def test_calculate_banner_dimensions(self, renderer):
         """Test banner dimension calculation."""
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            width, height = renderer.calculate_banner_dimensions("Test Text", "test_font", 64, 0)
-
-            # Width should accommodate text plus padding
-            assert width > (PADDING * 2)
-            # Height should accommodate text plus padding (dynamic sizing)
-            assert height > (PADDING * 2)
-
-    def test_render_text_square_mode(self, renderer):
-        """Test rendering in square mode produces correct size image."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000")
-        layout = LayoutConfig(mode="square", alignment="center")
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test", style, layout)
-
-            assert isinstance(image, Image.Image)
+        width, height = renderer.calculate_banner_dimensions("Test Text", "test_font", 64, 0)
+
+        # Width should accommodate text plus padding
+        assert width > (PADDING * 2)
+        # Height should accommodate text plus padding (dynamic sizing)
+        assert height > (PADDING * 2)
+
+    @pytest.mark.parametrize(
+        ("text", "style", "layout", "kwargs"),
+        [
+            pytest.param("Test", _RED, LayoutConfig(mode="square"), {}, id="square"),
+            pytest.param("Test Text", _RED, LayoutConfig(mode="banner"), {}, id="banner"),
+            pytest.param("Test", _RED, LayoutConfig(alignment="left"), {}, id="align-left"),
+            pytest.param("Test", _RED, LayoutConfig(alignment="right"), {}, id="align-right"),
+            pytest.param("Test", _OUTLINED, _LAYOUT, {}, id="outline"),
+            pytest.param("Test", _SHADOWED, _LAYOUT, {}, id="shadow"),
+            pytest.param(
+                "Test", _RED, _LAYOUT, {"custom_text_color": (0, 255, 0)}, id="custom-color"
+            ),
+            pytest.param("Line 1\nLine 2", _RED, _LAYOUT, {}, id="multiline"),
+        ],
+    )
+    def test_render_text(self, renderer, text, style, layout, kwargs):
+        """Test every style and layout variant renders an RGBA image of the right size."""
+        image = renderer.render_text(text, style, layout, **kwargs)
+
+        assert isinstance(image, Image.Image)
+        assert image.mode == "RGBA"
+        if layout.mode == "square":
             assert image.size == (SQUARE_SIZE, SQUARE_SIZE)
-            assert image.mode == "RGBA"
-
-    def test_render_text_banner_mode(self, renderer):
-        """Test rendering in banner mode produces dynamic width."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000")
-        layout = LayoutConfig(mode="banner", alignment="center")
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test Text", style, layout)
-
-            assert isinstance(image, Image.Image)
-            assert image.mode == "RGBA"
-
-    def test_render_text_alignment_left(self, renderer):
-        """Test left alignment positioning."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000")
-        layout = LayoutConfig(mode="square", alignment="left")
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test", style, layout)
-            assert image is not None
-
-    def test_render_text_alignment_right(self, renderer):
-        """Test right alignment positioning."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000")
-        layout = LayoutConfig(mode="square", alignment="right")
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test", style, layout)
-            assert image is not None
-
-    def test_render_text_with_outline(self, renderer):
-        """Test rendering with outline."""
-        style = TextStyle(
-            font_id="test_font", text_color="#FF0000", outline_color="#000000", outline_width=3
-        )
-        layout = LayoutConfig()
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test", style, layout)
-            assert image is not None
-
-    def test_render_text_with_shadow(self, renderer):
-        """Test rendering with shadow effect."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000", shadow=True)
-        layout = LayoutConfig()
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test", style, layout)
-            assert image is not None
-            assert image.mode == "RGBA"
-
-    def test_render_text_with_custom_color(self, renderer):
-        """Test rendering with custom text color override."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000")
-        layout = LayoutConfig()
-        custom_color = (0, 255, 0)
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Test", style, layout, custom_text_color=custom_color)
-            assert image is not None
-
-    def test_render_text_multiline(self, renderer):
-        """Test rendering multiline text."""
-        style = TextStyle(font_id="test_font", text_color="#FF0000")
-        layout = LayoutConfig()
-
-        with patch("src.core.text.font_manager") as mock_fm:
-            from PIL import ImageFont
-
-            mock_fm.get_font.return_value = ImageFont.load_default()
-
-            image = renderer.render_text("Line 1\nLine 2", style, layout)
-            assert image is not None
 
     def test_add_shadow_creates_blurred_layer(self, renderer):
         """Test shadow creation."""
         canvas = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
-        default_font = ImageFont.load_default()
-
-        result = renderer._add_shadow(canvas, "Test", default_font, 100, 100, 0)
+        result = renderer._add_shadow(canvas, "Test", _DEFAULT_FONT, 100, 100, 0)
 
         assert isinstance(result, Image.Image)
         assert result.mode == "RGBA"
         assert result.size == canvas.size
 
+    def test_add_shadow_is_black_with_blurred_alpha(self, renderer):
+        """Test shadow pixels are black and at most half opaque."""
+        canvas = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+        result = renderer._add_shadow(canvas, "Test", _DEFAULT_FONT, 10, 20, 0)
 
-class TestTextRendererConstants:
-    """Test module constants."""
-
-    def test_square_size(self):
-        """Test square size constant."""
-        assert SQUARE_SIZE == 256
+        r, g, b, a = result.split()
+        assert r.getextrema() == g.getextrema() == b.getextrema() == (0, 0)
+        assert 0 < a.getextrema()[1] <= 128
 
-    def test_default_height(self):
-        """Test default height constant."""
-        assert DEFAULT_HEIGHT == 256
 
-    def test_padding(self):
-        """Test padding constant."""
-        assert PADDING == 10
+class TestTextRendererConstants:
+    """Test module constants."""
 
-    def test_font_size_range(self):
-        """Test font size range constants."""
-        assert MIN_FONT_SIZE < MAX_FONT_SIZE
-        assert MIN_FONT_SIZE > 0
+    def test_constants(self):
+        """Test canvas, padding and font size range constants."""
+        assert (SQUARE_SIZE, DEFAULT_HEIGHT, PADDING) == (256, 256, 10)
+        assert 0 < MIN_FONT_SIZE < MAX_FONT_SIZE